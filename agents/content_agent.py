@@ -1,13 +1,53 @@
 """Content agent for generating final markdown content."""
 
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 from models.llm_interface import BaseLLM
-from utils.content_types import get_content_type_metadata
+from utils.content_types import (
+    get_content_type_metadata,
+    estimate_max_tokens,
+    estimate_section_max_tokens
+)
+from utils.llm_cache import cached_generate, cached_generate_stream
+from utils.prompt_compress import compress_data, COMPRESSION_THRESHOLD
+from agents.prompts import (
+    get_prompt,
+    SECTION_SYSTEM_PROMPT,
+    EDITOR_SYSTEM_PROMPT,
+    EXPAND_SYSTEM_PROMPT,
+    SEO_SYSTEM_PROMPT,
+    CONTENT_GUIDELINES,
+    SECTION_CLOSING_INSTRUCTIONS
+)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _build_system_prompt(content_type: str) -> str:
+    """
+    Build the system prompt for a content type.
+
+    Only the metadata fields vary between calls, so the rendered prompt is
+    cached per content type and reused byte-for-byte.
+
+    Args:
+        content_type: Content type value
+
+    Returns:
+        Rendered system prompt
+    """
+    metadata = get_content_type_metadata(content_type)
+
+    return get_prompt("writer").format(
+        name=metadata.name,
+        tone=metadata.tone,
+        ideal_length=metadata.ideal_length
+    )
+
+
 class ContentAgent:
     """Agent for generating final content."""
 
@@ -25,7 +65,8 @@ class ContentAgent:
         template: Dict[str, Any],
         data: str,
         serp_context: str = "",
-        additional_instructions: str = ""
+        additional_instructions: str = "",
+        bust_cache: bool = False
     ) -> str:
         """
         Generate complete content based on template and data.
@@ -35,122 +76,119 @@ class ContentAgent:
             data: Available data (formatted string)
             serp_context: Context from SerpAPI
             additional_instructions: Any additional instructions
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             Generated markdown content
         """
+        return "".join(
+            self.generate_content_stream(
+                template, data, serp_context, additional_instructions, bust_cache=bust_cache
+            )
+        ).strip()
+
+    def generate_content_stream(
+        self,
+        template: Dict[str, Any],
+        data: str,
+        serp_context: str = "",
+        additional_instructions: str = "",
+        bust_cache: bool = False
+    ) -> Iterator[str]:
+        """
+        Stream complete content based on template and data.
+
+        Args:
+            template: Content template/outline
+            data: Available data (formatted string)
+            serp_context: Context from SerpAPI
+            additional_instructions: Any additional instructions
+            bust_cache: Bypass the response cache for identical requests
+
+        Yields:
+            Markdown content chunks as the LLM produces them
+        """
         content_type = template.get('content_type', '')
-        metadata = get_content_type_metadata(content_type)
-
-        system_prompt = f"""You are an expert content writer specializing in Indian higher education and college-related content.
-
-Your writing should:
-1. Be informative, accurate, and well-researched
-2. Follow the {metadata.name} format
-3. Maintain a {metadata.tone} tone
-4. Target length: {metadata.ideal_length}
-5. Use proper markdown formatting
-6. Include relevant data and statistics
-7. Be engaging and reader-friendly for Indian audience
-8. Use SEO-friendly headings and structure
-
-INDIAN CONTEXT REQUIREMENTS:
-- Use Indian English style and vocabulary
-- Use lakhs/crores instead of hundreds of thousands/millions (e.g., "₹5 lakhs" not "$7,000")
-- Target Indian students, parents, and education stakers
-- Reference Indian education boards (CBSE, ICSE, State Boards)
-- Mention Indian entrance exams (JEE Main/Advanced, NEET, CAT, CLAT, GATE, etc.)
-- Use Indian accreditation bodies (UGC, AICTE, NAAC, NIRF)
-- Include Indian-specific topics (reservation categories, domicile requirements, state quota)
-- Use Indian terminology (college vs university, course vs program, LPA for salaries)
-
-CRITICAL DATA USAGE RULES (MUST FOLLOW):
-- ALWAYS use ACTUAL college names from the provided data
-- NEVER use placeholder names like "College X", "College Y", "College Z", "College A", "College B"
-- NEVER use generic terms like "the college", "this institution", "the university"
-- If data contains college names, you MUST use them verbatim
-- Every mention of a college MUST use its real name from the data
-
-STRUCTURED FORMAT REQUIREMENTS (VERY IMPORTANT):
-- MINIMIZE paragraph-heavy sections - max 2-3 short paragraphs per section
-- USE BULLET POINTS for lists, features, benefits, requirements, highlights
-- USE NUMBERED LISTS for steps, processes, procedures, sequential information
-- USE TABLES for comparisons, rankings, fees structure, placement statistics, program details
-- Convert data into structured formats (bullets/tables) wherever possible
-- Each section should have: 1 intro paragraph + structured content (bullets/tables/lists)
-
-Format:
-- Use # for main title (only once)
-- Use ## for main sections
-- Use ### for subsections
-- Use bullet points (-) extensively for lists
-- Use numbered lists (1., 2., 3.) for sequential content
-- Use **bold** for emphasis and key terms
-- Use tables (|) for data comparison and statistics
-- Use > blockquotes for important notes/highlights
-
-TABLE FORMAT EXAMPLES:
-- Rankings: | Rank Type | Position | Year |
-- Fees: | Program | Annual Fee | Total Fee |
-- Placements: | Year | Average CTC | Highest CTC | Placement % |
-- Comparison: | Feature | College A | College B |"""
+        system_prompt = _build_system_prompt(content_type)
 
-        # Create outline text from template
         outline_text = self._create_outline_text(template)
+        prompt = self._build_content_prompt(
+            template, data, serp_context, additional_instructions, outline_text
+        )
 
-        # Build optional sections separately to avoid f-string backslash issue
-        trends_section = ""
-        if serp_context:
-            trends_section = f"Current Context/Trends:\n{serp_context}\n\n"
-        
-        instructions_section = ""
-        if additional_instructions:
-            instructions_section = f"Additional Instructions:\n{additional_instructions}\n\n"
-
-        prompt = f"""Write comprehensive content following this outline:
+        max_tokens = estimate_max_tokens(get_content_type_metadata(content_type), outline_text)
+        logger.info("Content generation max_tokens budget: %d", max_tokens)
 
-# {template.get('title', 'Content')}
+        started = False
+        try:
+            for chunk in cached_generate_stream(
+                self.llm,
+                prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,
+                max_tokens=max_tokens,
+                bust_cache=bust_cache
+            ):
+                started = True
+                yield chunk
 
-Outline:
-{outline_text}
+            logger.info("Content generated successfully")
 
-Available Data to Incorporate:
-{data}
+        except Exception as e:
+            logger.error("Error generating content: %s", e)
+            if started:
+                yield f"\n\nError generating content: {str(e)}"
+            else:
+                yield f"# {template.get('title', 'Error')}\n\nError generating content: {str(e)}"
 
-{trends_section}{instructions_section}Generate the complete content in markdown format following these guidelines:
+    def generate_contents_batch(
+        self,
+        templates: List[Dict[str, Any]],
+        data: str,
+        serp_context: str = "",
+        additional_instructions: str = ""
+    ) -> List[str]:
+        """
+        Generate content for several templates as one provider batch job.
 
-CRITICAL RULES - MUST FOLLOW:
-1. ALWAYS use ACTUAL college names from the "Available Data to Incorporate" section above
-2. NEVER EVER use placeholder names like "College X", "College Y", "College Z", "College A", "College B"
-3. Extract the actual college names from the JSON data and use them throughout
-4. If comparing multiple colleges, use their real names in all comparisons and tables
-5. Example: Instead of "College X offers...", write "IIT Bombay offers..." (using actual name from data)
+        Intended for non-interactive bulk runs (refreshes, backfills): providers
+        with a Batch API process the job asynchronously at a discounted rate.
 
-Additional Guidelines:
-- Make it comprehensive, informative, and engaging
-- Use STRUCTURED FORMAT: prefer bullets, tables, and lists over long paragraphs
-- Include relevant data from the provided college information
-- Use Indian English and Indian education context
-- Write for Indian students, parents, and education seekers
-- Use lakhs/crores for money, LPA for salaries
-- Maximum 2-3 short paragraphs per section, rest should be bullets/tables/lists
+        Args:
+            templates: Content templates/outlines
+            data: Available data (formatted string)
+            serp_context: Context from SerpAPI
+            additional_instructions: Any additional instructions
 
-Content:"""
+        Returns:
+            Generated markdown content, in template order
+        """
+        requests = [
+            {
+                "prompt": self._build_content_prompt(template, data, serp_context, additional_instructions),
+                "system_prompt": _build_system_prompt(template.get('content_type', '')),
+                "temperature": 0.7,
+                "max_tokens": estimate_max_tokens(
+                    get_content_type_metadata(template.get('content_type', '')),
+                    self._create_outline_text(template)
+                )
+            }
+            for template in templates
+        ]
 
         try:
-            content = self.llm.generate(
-                prompt,
-                system_prompt=system_prompt,
-                temperature=0.7,
-                max_tokens=4000
-            )
+            results = self.llm.generate_batch(requests)
+        except Exception as e:
+            logger.error("Error generating content batch: %s", e)
+            return [
+                f"# {template.get('title', 'Error')}\n\nError generating content: {str(e)}"
+                for template in templates
+            ]
 
-            logger.info("Content generated successfully")
-            return content.strip()
+        contents = [content.strip() for content in results]
 
-        except Exception as e:
-            logger.error(f"Error generating content: {e}")
-            return f"# {template.get('title', 'Error')}\n\nError generating content: {str(e)}"
+        logger.info("Batch generated content for %d templates", len(contents))
+        return contents
 
     def generate_section(
         self,
@@ -171,44 +209,135 @@ Content:"""
         Returns:
             Generated section content
         """
-        system_prompt = """You are an expert content writer. Generate detailed, informative content for a specific section."""
-
-        # Build context section separately to avoid f-string backslash issue
-        context_section = ""
-        if context:
-            context_section = f"Context:\n{context}\n\n"
-
-        prompt = f"""Write detailed content for this section:
+        return "".join(
+            self.generate_section_stream(section_title, section_outline, data, context)
+        ).strip()
 
-Section Title: {section_title}
+    def generate_section_stream(
+        self,
+        section_title: str,
+        section_outline: str,
+        data: str,
+        context: str = ""
+    ) -> Iterator[str]:
+        """
+        Stream content for a specific section.
 
-Section Outline:
-{section_outline}
+        Args:
+            section_title: Title of the section
+            section_outline: Outline/bullet points for the section
+            data: Available data
+            context: Additional context
 
-Available Data:
-{data}
+        Yields:
+            Section content chunks as the LLM produces them
+        """
+        prompt = self._build_section_prompt(section_title, section_outline, data, context)
 
-{context_section}Generate comprehensive content for this section in markdown format.
-Use appropriate sub-headings, bullet points, and formatting."""
+        max_tokens = estimate_section_max_tokens(section_outline)
+        logger.info("Section generation max_tokens budget: %d", max_tokens)
 
+        started = False
         try:
-            section_content = self.llm.generate(
+            for chunk in self.llm.generate_stream(
                 prompt,
-                system_prompt=system_prompt,
+                system_prompt=SECTION_SYSTEM_PROMPT,
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=max_tokens
+            ):
+                started = True
+                yield chunk
+
+        except Exception as e:
+            logger.error("Error generating section: %s", e)
+            if started:
+                yield "\n\nError generating section content."
+            else:
+                yield f"## {section_title}\n\nError generating section content."
+
+    def generate_sections(
+        self,
+        template: Dict[str, Any],
+        data: str,
+        context: str = "",
+        max_concurrency: int = 4
+    ) -> List[str]:
+        """
+        Generate every template section concurrently in a thread pool.
+
+        Args:
+            template: Content template/outline
+            data: Available data
+            context: Additional context
+            max_concurrency: Maximum in-flight LLM calls
+
+        Returns:
+            Generated section contents, in template order
+        """
+        sections = template.get('sections', [])
+        if not sections:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(
+                lambda section: self.generate_section(
+                    section['title'],
+                    self._create_section_outline(section).strip(),
+                    data,
+                    context
+                ),
+                sections
+            ))
+
+    def generate_content_by_sections(
+        self,
+        template: Dict[str, Any],
+        data: str,
+        serp_context: str = "",
+        additional_instructions: str = "",
+        max_concurrency: int = 4,
+        bust_cache: bool = False
+    ) -> str:
+        """
+        Generate complete content with one concurrent LLM call per template section.
+
+        Wall time is bounded by the slowest section rather than one long
+        generation. Templates without sections fall back to generate_content.
+
+        Args:
+            template: Content template/outline
+            data: Available data (formatted string)
+            serp_context: Context from SerpAPI
+            additional_instructions: Any additional instructions
+            max_concurrency: Maximum in-flight LLM calls
+            bust_cache: Bypass the response cache when falling back to generate_content
+
+        Returns:
+            Generated markdown content, sections in template order
+        """
+        if not template.get('sections'):
+            return self.generate_content(
+                template, data, serp_context, additional_instructions, bust_cache=bust_cache
             )
 
-            return section_content.strip()
+        context = "\n\n".join(part for part in (serp_context, additional_instructions) if part)
+        section_contents = self.generate_sections(template, data, context, max_concurrency)
 
-        except Exception as e:
-            logger.error(f"Error generating section: {e}")
-            return f"## {section_title}\n\nError generating section content."
+        parts = [f"# {template.get('title', 'Content')}"]
+        for section, section_content in zip(template['sections'], section_contents):
+            # Keep the outline's heading when the LLM did not write one
+            if not section_content.lstrip().startswith('#'):
+                parts.append(f"## {section['title']}")
+            parts.append(section_content)
+
+        logger.info("Content generated from %d sections", len(section_contents))
+        return "\n\n".join(parts)
 
     def regenerate_content(
         self,
         original_content: str,
-        regeneration_instructions: str
+        regeneration_instructions: str,
+        bust_cache: bool = False
     ) -> str:
         """
         Regenerate content based on user feedback.
@@ -216,12 +345,11 @@ Use appropriate sub-headings, bullet points, and formatting."""
         Args:
             original_content: Original generated content
             regeneration_instructions: User's instructions for changes
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             Regenerated content
         """
-        system_prompt = """You are an expert content editor. Improve and modify content based on user feedback while maintaining quality and structure."""
-
         prompt = f"""Modify this content based on user feedback:
 
 Original Content:
@@ -233,24 +361,27 @@ User Feedback/Instructions:
 Generate the improved content in markdown format."""
 
         try:
-            new_content = self.llm.generate(
+            new_content = cached_generate(
+                self.llm,
                 prompt,
-                system_prompt=system_prompt,
+                system_prompt=EDITOR_SYSTEM_PROMPT,
                 temperature=0.7,
-                max_tokens=4000
+                max_tokens=4000,
+                bust_cache=bust_cache
             )
 
             logger.info("Content regenerated successfully")
             return new_content.strip()
 
         except Exception as e:
-            logger.error(f"Error regenerating content: {e}")
+            logger.error("Error regenerating content: %s", e)
             return original_content
 
     def expand_section(
         self,
         section_content: str,
-        expansion_instructions: str = "Make this section more detailed and comprehensive"
+        expansion_instructions: str = "Make this section more detailed and comprehensive",
+        bust_cache: bool = False
     ) -> str:
         """
         Expand a specific section of content.
@@ -258,12 +389,11 @@ Generate the improved content in markdown format."""
         Args:
             section_content: Current section content
             expansion_instructions: How to expand
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             Expanded section content
         """
-        system_prompt = """You are an expert content writer. Expand content sections with more detail, examples, and insights."""
-
         prompt = f"""Expand this content section:
 
 Current Content:
@@ -275,19 +405,98 @@ Instructions:
 Generate the expanded version with more detail, examples, and insights."""
 
         try:
-            expanded = self.llm.generate(
+            expanded = cached_generate(
+                self.llm,
                 prompt,
-                system_prompt=system_prompt,
+                system_prompt=EXPAND_SYSTEM_PROMPT,
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=2000,
+                bust_cache=bust_cache
             )
 
             return expanded.strip()
 
         except Exception as e:
-            logger.error(f"Error expanding section: {e}")
+            logger.error("Error expanding section: %s", e)
             return section_content
 
+    def _build_content_prompt(
+        self,
+        template: Dict[str, Any],
+        data: str,
+        serp_context: str = "",
+        additional_instructions: str = "",
+        outline_text: Optional[str] = None
+    ) -> str:
+        """
+        Build the user prompt for full content generation.
+
+        Args:
+            template: Content template/outline
+            data: Available data (formatted string)
+            serp_context: Context from SerpAPI
+            additional_instructions: Any additional instructions
+            outline_text: Pre-rendered outline (built from template if omitted)
+
+        Returns:
+            Prompt text
+        """
+        # Create outline text from template
+        if outline_text is None:
+            outline_text = self._create_outline_text(template)
+
+        # Large college data blobs dominate input tokens; strip their redundancy
+        if len(data) > COMPRESSION_THRESHOLD:
+            data = compress_data(data)
+
+        # Headed blocks are only included when they have content
+        parts = [
+            CONTENT_GUIDELINES,
+            f"Write comprehensive content following this outline:\n\n# {template.get('title', 'Content')}"
+        ]
+        if outline_text:
+            parts.append(f"Outline:\n{outline_text}")
+        if data:
+            parts.append(f"Available Data to Incorporate:\n{data}")
+        if serp_context:
+            parts.append(f"Current Context/Trends:\n{serp_context}")
+        if additional_instructions:
+            parts.append(f"Additional Instructions:\n{additional_instructions}")
+        parts.append("Content:")
+
+        return "\n\n".join(parts)
+
+    def _build_section_prompt(
+        self,
+        section_title: str,
+        section_outline: str,
+        data: str,
+        context: str = ""
+    ) -> str:
+        """
+        Build the user prompt for a single section.
+
+        Args:
+            section_title: Title of the section
+            section_outline: Outline/bullet points for the section
+            data: Available data
+            context: Additional context
+
+        Returns:
+            Prompt text
+        """
+        # Headed blocks are only included when they have content
+        parts = [f"Write detailed content for this section:\n\nSection Title: {section_title}"]
+        if section_outline:
+            parts.append(f"Section Outline:\n{section_outline}")
+        if data:
+            parts.append(f"Available Data:\n{data}")
+        if context:
+            parts.append(f"Context:\n{context}")
+        parts.append(SECTION_CLOSING_INSTRUCTIONS)
+
+        return "\n\n".join(parts)
+
     def _create_outline_text(self, template: Dict[str, Any]) -> str:
         """
         Create outline text from template structure.
@@ -298,34 +507,50 @@ Generate the expanded version with more detail, examples, and insights."""
         Returns:
             Formatted outline text
         """
-        outline = ""
+        parts = []
+        append = parts.append
 
         for section in template.get('sections', []):
-            outline += f"\n## {section['title']}\n"
+            append(f"\n## {section['title']}\n")
+            append(self._create_section_outline(section))
 
-            for point in section.get('points', []):
-                outline += f"- {point}\n"
+        return "".join(parts).strip()
 
-            for subsection in section.get('subsections', []):
-                outline += f"\n### {subsection['title']}\n"
-                for point in subsection.get('points', []):
-                    outline += f"- {point}\n"
+    def _create_section_outline(self, section: Dict[str, Any]) -> str:
+        """
+        Create outline text for the points and subsections of one section.
 
-        return outline.strip()
+        Args:
+            section: Section dictionary
 
-    def add_seo_elements(self, content: str, keywords: list) -> str:
+        Returns:
+            Formatted section outline (without the section heading)
+        """
+        parts = []
+        append = parts.append
+
+        for point in section.get('points') or ():
+            append(f"- {point}\n")
+
+        for subsection in section.get('subsections') or ():
+            append(f"\n### {subsection['title']}\n")
+            for point in subsection.get('points') or ():
+                append(f"- {point}\n")
+
+        return "".join(parts)
+
+    def add_seo_elements(self, content: str, keywords: list, bust_cache: bool = False) -> str:
         """
         Enhance content with SEO elements.
 
         Args:
             content: Original content
             keywords: Target keywords
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             SEO-enhanced content
         """
-        system_prompt = """You are an SEO content specialist. Enhance content with SEO best practices while maintaining readability and quality."""
-
         prompt = f"""Enhance this content with SEO best practices:
 
 Original Content:
@@ -342,14 +567,16 @@ Add:
 Return the enhanced content in markdown format."""
 
         try:
-            enhanced = self.llm.generate(
+            enhanced = cached_generate(
+                self.llm,
                 prompt,
-                system_prompt=system_prompt,
-                temperature=0.6
+                system_prompt=SEO_SYSTEM_PROMPT,
+                temperature=0.6,
+                bust_cache=bust_cache
             )
 
             return enhanced.strip()
 
         except Exception as e:
-            logger.error(f"Error adding SEO elements: {e}")
+            logger.error("Error adding SEO elements: %s", e)
             return content
\ No newline at end of file
@@ -1,12 +1,173 @@
 """Simplified query agent using materialized view for college data."""
 
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Iterable, Mapping, Tuple, Union
 from models.llm_interface import BaseLLM
 from database.connection import DatabaseConnection
+from config.database import COLLEGE_DATA_VIEW
 
 logger = logging.getLogger(__name__)
 
+# Keyword -> substrings of the lowercased query that imply it, in output order
+KEYWORD_TRIGGERS = (
+    ('engineering', ('engineering', 'iit', 'nit')),
+    ('medical', ('medical', 'mbbs', 'aiims')),
+    ('law', ('law', 'nliu')),
+    ('management', ('management', 'mba', 'iim')),
+    ('ranking', ('ranking', 'nirf')),
+    ('fees', ('fee', 'cost', 'tuition')),
+    ('admission', ('admission', 'entrance')),
+)
+DEFAULT_KEYWORDS = ('college', 'education')
+# College rows kept by get_college_by_id/get_colleges_by_ids, and for how long;
+# the TTL matches the app's college list cache so refreshed view data shows up
+COLLEGE_CACHE_SIZE = 1024
+COLLEGE_CACHE_TTL = 3600
+
+# Map user-friendly field names to actual database column names
+FIELD_NAME_MAPPING = {
+    'address': 'full_address',
+    'faculty_ratio': 'faculty_student_ratio',
+    'utilities': 'essential_utilities'
+}
+# Fields that are not available in the mvx_college_data_flattened view
+INVALID_FIELDS = frozenset((
+    'alternative_names',  # Column doesn't exist
+    'is_college_verified',  # Column doesn't exist
+    'placements',  # Column doesn't exist (may be in a different table)
+    'alumni',  # Column doesn't exist (may be in a different table)
+    'fees'  # Column doesn't exist (fees are in degrees JSON, not a separate column)
+))
+# Always selected, ahead of any requested fields
+ESSENTIAL_FIELDS = ('college_id', 'name', 'city', 'state')
+
+# A field is a column name or an (alias, jsonb_path) pair such as
+# ('nirf_rank', "rankings->'nirf'->>'rank'"), which selects one JSONB value
+FieldSpec = Union[str, Tuple[str, str]]
+_ALIAS_RE = re.compile(r'[a-z_][a-z0-9_]*')
+_JSONB_PATH_RE = re.compile(r"[a-z_][a-z0-9_]*(?:\s*->>?\s*(?:'[\w .-]+'|\d+))+", re.IGNORECASE)
+
+# Common Indian cities and states; earlier entries win when a query names several
+CITIES = (
+    'mumbai', 'delhi', 'bangalore', 'chennai', 'kolkata', 'hyderabad',
+    'pune', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur', 'nagpur',
+    'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri', 'patna',
+    'vadodara', 'ghaziabad', 'ludhiana', 'agra', 'nashik', 'faridabad',
+    'meerut', 'rajkot', 'kalyan', 'vasai', 'varanasi', 'srinagar'
+)
+STATES = (
+    'maharashtra', 'karnataka', 'tamil nadu', 'delhi', 'west bengal',
+    'telangana', 'gujarat', 'rajasthan', 'uttar pradesh', 'madhya pradesh',
+    'bihar', 'andhra pradesh', 'kerala', 'punjab', 'haryana', 'odisha',
+    'jharkhand', 'assam', 'chhattisgarh', 'uttarakhand', 'himachal pradesh',
+    'goa', 'jammu and kashmir', 'manipur', 'meghalaya', 'nagaland',
+    'sikkim', 'tripura', 'arunachal pradesh', 'mizoram'
+)
+
+# Predefined field groups for easy selection (read-only, shared by all callers)
+FIELD_GROUPS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Basic Info': (
+        'college_id', 'name', 'city', 'state', 'district',
+        'year_of_established', 'website', 'college_is_active'
+    ),
+    'Rankings & Accreditation': (
+        'rankings', 'accreditations'
+    ),
+    'Academics & Programs': (
+        'degrees', 'faculty_ratio'  # Maps to 'faculty_student_ratio' in DB
+        # Note: 'fees' is not a separate column - fee information is in degrees JSON
+    ),
+    'Infrastructure & Facilities': (
+        'infrastructure', 'nearby_places', 'utilities'  # Maps to 'essential_utilities' in DB
+    ),
+    'Contact & Location': (
+        'contact_info', 'address', 'city', 'state', 'district'  # 'address' maps to 'full_address' in DB
+    )
+    # Note: 'placements' and 'alumni' are not available in mvx_college_data_flattened view
+})
+
+# Common fields reported when the view schema cannot be read
+FALLBACK_SCHEMA: Tuple[Dict[str, str], ...] = tuple(
+    {'column_name': column_name, 'data_type': data_type}
+    for column_name, data_type in (
+        ('college_id', 'integer'),
+        ('name', 'text'),
+        ('city', 'text'),
+        ('state', 'text'),
+        ('year_of_established', 'integer'),
+        ('website', 'text'),
+        ('rankings', 'jsonb'),
+        ('accreditations', 'jsonb'),
+        ('degrees', 'jsonb'),
+        ('infrastructure', 'jsonb'),
+    )
+)
+
+
+def _compile_vocabulary(terms: Iterable[str]) -> re.Pattern:
+    """Compile terms into one pattern that reports every (overlapping) occurrence."""
+    return re.compile('(?=(' + '|'.join(map(re.escape, terms)) + '))')
+
+
+# One regex pass per vocabulary instead of one substring scan per term
+_CITY_RE = _compile_vocabulary(CITIES)
+_STATE_RE = _compile_vocabulary(STATES)
+_TRIGGER_RE = _compile_vocabulary(
+    trigger for _, triggers in KEYWORD_TRIGGERS for trigger in triggers
+)
+_CITY_RANK = {city: rank for rank, city in enumerate(CITIES)}
+_STATE_RANK = {state: rank for rank, state in enumerate(STATES)}
+_TRIGGER_KEYWORD = {
+    trigger: keyword for keyword, triggers in KEYWORD_TRIGGERS for trigger in triggers
+}
+
+
+def _first_by_rank(pattern: re.Pattern, ranks: Dict[str, int], text: str) -> Optional[str]:
+    """Return the highest-priority vocabulary term found in text, if any."""
+    found = set(pattern.findall(text))
+    return min(found, key=ranks.__getitem__) if found else None
+
+
+@lru_cache(maxsize=512)
+def _match_location(query_lower: str) -> Tuple[Optional[str], Optional[str]]:
+    """Find the lowercase (city, state) named in a lowercased query, memoized per query."""
+    return (
+        _first_by_rank(_CITY_RE, _CITY_RANK, query_lower),
+        _first_by_rank(_STATE_RE, _STATE_RANK, query_lower)
+    )
+
+
+@lru_cache(maxsize=512)
+def _match_keywords(query_lower: str) -> Tuple[str, ...]:
+    """Find the keywords implied by a lowercased query, memoized per query."""
+    found = {_TRIGGER_KEYWORD[trigger] for trigger in _TRIGGER_RE.findall(query_lower)}
+    return tuple(keyword for keyword, _ in KEYWORD_TRIGGERS if keyword in found)
+
+
+def _select_item(field: FieldSpec) -> Optional[str]:
+    """Render one field spec as a SELECT item, or None if it is not selectable."""
+    if isinstance(field, str):
+        return None if field in INVALID_FIELDS else FIELD_NAME_MAPPING.get(field, field)
+
+    alias, path = field
+    if not (_ALIAS_RE.fullmatch(alias) and _JSONB_PATH_RE.fullmatch(path)):
+        logger.warning("Ignoring invalid JSONB field spec: %r", field)
+        return None
+    return f"{path} AS {alias}"
+
+
+@lru_cache(maxsize=256)
+def _column_list(selected_fields: Tuple[FieldSpec, ...]) -> str:
+    """Map, filter and de-duplicate requested fields into a SELECT column list."""
+    items = (_select_item(field) for field in selected_fields)
+    return ', '.join(dict.fromkeys((*ESSENTIAL_FIELDS, *filter(None, items))))
+
 
 class SimpleQueryAgent:
     """Simplified agent that uses mvx_college_data_flattened materialized view."""
@@ -21,6 +182,11 @@ class SimpleQueryAgent:
         """
         self.llm = llm
         self.db = db
+        # LRU of (stored_at, row) by (college_id, column list) and the view
+        # schema; call invalidate_college_cache() after COLLEGE_DATA_VIEW is refreshed
+        self._college_cache: "OrderedDict[Tuple[int, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._college_cache_lock = threading.Lock()
+        self._available_fields: Optional[List[Dict[str, str]]] = None
 
     def fetch_college_data(
         self,
@@ -28,7 +194,7 @@ class SimpleQueryAgent:
         content_type: str,
         selected_college_id: Optional[int] = None,
         selected_college_ids: Optional[List[int]] = None,
-        selected_fields: Optional[List[str]] = None,
+        selected_fields: Optional[List[FieldSpec]] = None,
         limit: int = 50
     ) -> Dict[str, Any]:
         """
@@ -39,7 +205,8 @@ class SimpleQueryAgent:
             content_type: Type of content
             selected_college_id: Optional specific college ID to filter by
             selected_college_ids: Optional list of college IDs (for comparison)
-            selected_fields: Optional list of specific fields to fetch (None = all fields)
+            selected_fields: Optional list of specific fields to fetch (None = all fields);
+                (alias, jsonb_path) pairs fetch a single value out of a JSONB column
             limit: Maximum number of colleges to fetch
 
         Returns:
@@ -47,104 +214,76 @@ class SimpleQueryAgent:
         """
         try:
             # Determine which fields to select
-            if selected_fields:
-                # Filter out fields that don't exist in the database
-                # These fields are not available in mvx_college_data_flattened view
-                # Map user-friendly field names to actual database column names
-                field_name_mapping = {
-                    'address': 'full_address',  # User-friendly name -> actual column name
-                    'faculty_ratio': 'faculty_student_ratio',  # User-friendly name -> actual column name
-                    'utilities': 'essential_utilities'  # User-friendly name -> actual column name
-                }
-                
-                # Fields that don't exist in the database
-                invalid_fields = [
-                    'alternative_names',  # Column doesn't exist
-                    'is_college_verified',  # Column doesn't exist
-                    'placements',  # Column doesn't exist (may be in a different table)
-                    'alumni',  # Column doesn't exist (may be in a different table)
-                    'fees'  # Column doesn't exist (fees are in degrees JSON, not a separate column)
-                ]
-                
-                # Map field names and filter invalid ones
-                mapped_fields = []
-                for field in selected_fields:
-                    if field in invalid_fields:
-                        continue  # Skip invalid fields
-                    # Use mapped name if available, otherwise use original
-                    mapped_fields.append(field_name_mapping.get(field, field))
-                
-                filtered_fields = mapped_fields
-                
-                # Ensure essential fields are always included
-                essential_fields = ['college_id', 'name', 'city', 'state']
-                all_fields = list(set(essential_fields + filtered_fields))
-                field_list = ', '.join(all_fields)
-                logger.info(f"Using custom field selection: {len(all_fields)} fields (filtered out {len(selected_fields) - len(filtered_fields)} invalid fields)")
-            else:
-                field_list = '*'
-                logger.info("Using all fields")
+            field_list = self._build_field_list(selected_fields)
 
             # Build simple query using materialized view
             if selected_college_ids and len(selected_college_ids) > 0:
                 # Fetch multiple specific colleges (for comparison)
-                id_list = ','.join(map(str, selected_college_ids))
+                # One array parameter keeps a single query shape for any list length
                 sql_query = f"""
                     SELECT {field_list}
-                    FROM mvx_college_data_flattened
-                    WHERE college_id IN ({id_list})
+                    FROM {COLLEGE_DATA_VIEW}
+                    WHERE college_id = ANY(%s::int[])
                         AND college_is_active = true
                     ORDER BY college_id;
                 """
-                logger.info(f"Fetching {len(selected_college_ids)} colleges for comparison: {selected_college_ids}")
+                params = ([int(college_id) for college_id in selected_college_ids],)
+                logger.info("Fetching %d colleges for comparison: %s", len(selected_college_ids), selected_college_ids)
             elif selected_college_id:
                 # Fetch single specific college
                 sql_query = f"""
                     SELECT {field_list}
-                    FROM mvx_college_data_flattened
-                    WHERE college_id = {selected_college_id}
+                    FROM {COLLEGE_DATA_VIEW}
+                    WHERE college_id = %s
                         AND college_is_active = true
                     LIMIT 1;
                 """
-                logger.info(f"Fetching data for college_id={selected_college_id}")
+                params = (selected_college_id,)
+                logger.info("Fetching data for college_id=%s", selected_college_id)
             else:
                 # Fetch multiple colleges based on query context
                 filters = self._extract_filters_from_query(user_query)
 
                 where_clauses = ["college_is_active = true"]
+                filter_params = []
 
+                # Filter values are already lowercase, so only the column side
+                # is folded and an index on LOWER(city) / LOWER(state) applies
                 if filters.get('city'):
-                    where_clauses.append(f"LOWER(city) = LOWER('{filters['city']}')")
+                    where_clauses.append("LOWER(city) = %s")
+                    filter_params.append(filters['city'])
                 if filters.get('state'):
-                    where_clauses.append(f"LOWER(state) = LOWER('{filters['state']}')")
+                    where_clauses.append("LOWER(state) = %s")
+                    filter_params.append(filters['state'])
 
                 where_clause = " AND ".join(where_clauses)
 
                 sql_query = f"""
                     SELECT {field_list}
-                    FROM mvx_college_data_flattened
+                    FROM {COLLEGE_DATA_VIEW}
                     WHERE {where_clause}
                     ORDER BY year_of_established DESC NULLS LAST
-                    LIMIT {limit};
+                    LIMIT %s;
                 """
-                logger.info(f"Fetching colleges with filters: {filters}")
+                params = (*filter_params, limit)
+                logger.info("Fetching colleges with filters: %s", filters)
 
             # Execute query
-            data = self.db.execute_query(sql_query)
+            data = self.db.execute_query(sql_query, params)
 
-            logger.info(f"Data fetched successfully: {len(data)} rows")
+            logger.info("Data fetched successfully: %d rows", len(data))
 
             return {
                 "analysis": f"Fetching college data based on: {user_query}",
                 "keywords": self._extract_keywords(user_query),
-                "relevant_tables": ["mvx_college_data_flattened"],
+                "relevant_tables": [COLLEGE_DATA_VIEW],
                 "sql_query": sql_query,
                 "data": data,
                 "row_count": len(data)
             }
 
         except Exception as e:
-            logger.error(f"Error fetching data: {e}")
+            logger.error("Error fetching data: %s", e)
             return {
                 "analysis": "",
                 "keywords": [],
@@ -154,6 +293,29 @@ class SimpleQueryAgent:
                 "row_count": 0
             }
 
+    def _build_field_list(self, selected_fields: Optional[List[FieldSpec]]) -> str:
+        """
+        Build the SELECT column list for mvx_college_data_flattened.
+
+        Args:
+            selected_fields: User-facing field names or (alias, jsonb_path)
+                pairs (None = all fields)
+
+        Returns:
+            Comma-separated column list, or '*' for all fields
+        """
+        if not selected_fields:
+            logger.info("Using all fields")
+            return '*'
+
+        # Sorted key: the same selection always yields the same SQL text
+        field_list = _column_list(tuple(sorted(selected_fields, key=str)))
+        logger.info(
+            "Using custom field selection: %d fields (filtered out %d invalid fields)",
+            field_list.count(',') + 1, sum(field in INVALID_FIELDS for field in selected_fields)
+        )
+        return field_list
+
     def _extract_filters_from_query(self, user_query: str) -> Dict[str, str]:
         """
         Extract simple filters from user query.
@@ -165,32 +327,12 @@ class SimpleQueryAgent:
             Dictionary of filters
         """
         filters = {}
-        query_lower = user_query.lower()
-
-        # Common Indian cities
-        cities = ['mumbai', 'delhi', 'bangalore', 'chennai', 'kolkata', 'hyderabad',
-                  'pune', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur', 'nagpur',
-                  'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri', 'patna',
-                  'vadodara', 'ghaziabad', 'ludhiana', 'agra', 'nashik', 'faridabad',
-                  'meerut', 'rajkot', 'kalyan', 'vasai', 'varanasi', 'srinagar']
-
-        for city in cities:
-            if city in query_lower:
-                filters['city'] = city.title()
-                break
-
-        # Common Indian states
-        states = ['maharashtra', 'karnataka', 'tamil nadu', 'delhi', 'west bengal',
-                  'telangana', 'gujarat', 'rajasthan', 'uttar pradesh', 'madhya pradesh',
-                  'bihar', 'andhra pradesh', 'kerala', 'punjab', 'haryana', 'odisha',
-                  'jharkhand', 'assam', 'chhattisgarh', 'uttarakhand', 'himachal pradesh',
-                  'goa', 'jammu and kashmir', 'manipur', 'meghalaya', 'nagaland',
-                  'sikkim', 'tripura', 'arunachal pradesh', 'mizoram']
-
-        for state in states:
-            if state in query_lower:
-                filters['state'] = state.title()
-                break
+        city, state = _match_location(user_query.lower())
+
+        if city:
+            filters['city'] = city
+        if state:
+            filters['state'] = state
 
         return filters
 
@@ -204,58 +346,135 @@ class SimpleQueryAgent:
         Returns:
             List of keywords
         """
-        # Simple keyword extraction
-        keywords = []
-        query_lower = query.lower()
-
-        if 'engineering' in query_lower or 'iit' in query_lower or 'nit' in query_lower:
-            keywords.append('engineering')
-        if 'medical' in query_lower or 'mbbs' in query_lower or 'aiims' in query_lower:
-            keywords.append('medical')
-        if 'law' in query_lower or 'nliu' in query_lower:
-            keywords.append('law')
-        if 'management' in query_lower or 'mba' in query_lower or 'iim' in query_lower:
-            keywords.append('management')
-        if 'ranking' in query_lower or 'nirf' in query_lower:
-            keywords.append('ranking')
-        if 'fee' in query_lower or 'cost' in query_lower or 'tuition' in query_lower:
-            keywords.append('fees')
-        if 'admission' in query_lower or 'entrance' in query_lower:
-            keywords.append('admission')
-
-        return keywords if keywords else ['college', 'education']
-
-    def get_college_by_id(self, college_id: int) -> Optional[Dict[str, Any]]:
+        keywords = _match_keywords(query.lower())
+
+        return list(keywords or DEFAULT_KEYWORDS)
+
+    def get_college_by_id(
+        self,
+        college_id: int,
+        fields: Optional[List[FieldSpec]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Get full college data by ID.
+        Get college data by ID.
 
         Args:
             college_id: College ID
+            fields: Fields to fetch (None = the 'Basic Info' group; JSONB
+                columns such as rankings or degrees must be requested explicitly)
 
         Returns:
             College data dictionary or None
         """
+        field_list = self._build_field_list(list(fields or FIELD_GROUPS['Basic Info']))
+        cache_key = (college_id, field_list)
+
+        cached = self._get_cached_college(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
             sql_query = f"""
-                SELECT *
-                FROM mvx_college_data_flattened
-                WHERE college_id = {college_id}
+                SELECT {field_list}
+                FROM {COLLEGE_DATA_VIEW}
+                WHERE college_id = %s
                     AND college_is_active = true;
             """
 
-            data = self.db.execute_query(sql_query)
+            data = self.db.execute_query(sql_query, (college_id,))
 
             if data:
-                logger.info(f"Retrieved college data for ID {college_id}")
-                return data[0]
+                logger.info("Retrieved college data for ID %s", college_id)
+                self._cache_college(cache_key, data[0])
+                return dict(data[0])
             else:
-                logger.warning(f"No college found with ID {college_id}")
+                logger.warning("No college found with ID %s", college_id)
                 return None
 
         except Exception as e:
-            logger.error(f"Error fetching college by ID: {e}")
+            logger.error("Error fetching college by ID: %s", e)
             return None
 
+    def get_colleges_by_ids(
+        self,
+        college_ids: Iterable[int],
+        fields: Optional[List[FieldSpec]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get data for several colleges in one round-trip.
+
+        Ids already cached by get_college_by_id are served from the cache;
+        the rest are fetched with a single query and cached in turn.
+
+        Args:
+            college_ids: College IDs
+            fields: Fields to fetch (None = the 'Basic Info' group)
+
+        Returns:
+            Dictionary mapping college ID to college data; IDs with no
+            active college are omitted
+        """
+        field_list = self._build_field_list(list(fields or FIELD_GROUPS['Basic Info']))
+        colleges: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+
+        for college_id in dict.fromkeys(int(college_id) for college_id in college_ids):
+            cached = self._get_cached_college((college_id, field_list))
+            if cached is not None:
+                colleges[college_id] = dict(cached)
+            else:
+                missing.append(college_id)
+
+        if not missing:
+            return colleges
+
+        try:
+            sql_query = f"""
+                SELECT {field_list}
+                FROM {COLLEGE_DATA_VIEW}
+                WHERE college_id = ANY(%s::int[])
+                    AND college_is_active = true;
+            """
+
+            data = self.db.execute_query(sql_query, (missing,))
+            logger.info("Retrieved %d of %d requested colleges", len(data), len(missing))
+
+            for row in data:
+                self._cache_college((row['college_id'], field_list), row)
+                colleges[row['college_id']] = dict(row)
+
+        except Exception as e:
+            logger.error("Error fetching colleges by ID: %s", e)
+
+        return colleges
+
+    def _get_cached_college(self, key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+        """Get a cached college row unless it has expired, marking it as recently used."""
+        with self._college_cache_lock:
+            entry = self._college_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, row = entry
+            if time.monotonic() - stored_at > COLLEGE_CACHE_TTL:
+                del self._college_cache[key]
+                return None
+            self._college_cache.move_to_end(key)
+            return row
+
+    def _cache_college(self, key: Tuple[int, str], row: Dict[str, Any]) -> None:
+        """Cache a college row, evicting the least recently used rows if full."""
+        with self._college_cache_lock:
+            self._college_cache[key] = (time.monotonic(), row)
+            self._college_cache.move_to_end(key)
+            while len(self._college_cache) > COLLEGE_CACHE_SIZE:
+                self._college_cache.popitem(last=False)
+
+    def invalidate_college_cache(self) -> None:
+        """Drop cached college rows and schema, e.g. after the view is refreshed."""
+        with self._college_cache_lock:
+            self._college_cache.clear()
+        self._available_fields = None
+
     def search_colleges(self, search_term: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Search colleges by name, city, or state.
@@ -268,6 +487,8 @@ class SimpleQueryAgent:
             List of matching colleges
         """
         try:
+            # ILIKE '%term%' is served by the pg_trgm GIN indexes described
+            # in CLAUDE.md; without them this scans the whole view
             sql_query = f"""
                 SELECT
                     college_id,
@@ -276,23 +497,24 @@ class SimpleQueryAgent:
                     state,
                     year_of_established,
                     website
-                FROM mvx_college_data_flattened
+                FROM {COLLEGE_DATA_VIEW}
                 WHERE college_is_active = true
                     AND (
-                        LOWER(name) LIKE LOWER('%{search_term}%')
-                        OR LOWER(city) LIKE LOWER('%{search_term}%')
-                        OR LOWER(state) LIKE LOWER('%{search_term}%')
+                        name ILIKE %s
+                        OR city ILIKE %s
+                        OR state ILIKE %s
                     )
                 ORDER BY name
-                LIMIT {limit};
+                LIMIT %s;
             """
 
-            data = self.db.execute_query(sql_query)
-            logger.info(f"Found {len(data)} colleges matching '{search_term}'")
+            pattern = f"%{search_term}%"
+            data = self.db.execute_query(sql_query, (pattern, pattern, pattern, limit))
+            logger.info("Found %d colleges matching '%s'", len(data), search_term)
             return data
 
         except Exception as e:
-            logger.error(f"Error searching colleges: {e}")
+            logger.error("Error searching colleges: %s", e)
             return []
 
     def get_available_fields(self) -> List[Dict[str, str]]:
@@ -302,50 +524,24 @@ class SimpleQueryAgent:
         Returns:
             List of dictionaries with column_name, data_type
         """
+        if self._available_fields is not None:
+            return list(self._available_fields)
+
         try:
-            schema = self.db.get_table_schema('mvx_college_data_flattened')
-            logger.info(f"Retrieved {len(schema)} fields from schema")
-            return schema
+            schema = self.db.get_table_schema(COLLEGE_DATA_VIEW)
+            logger.info("Retrieved %d fields from schema", len(schema))
+            self._available_fields = schema
+            return list(schema)
         except Exception as e:
-            logger.error(f"Error fetching schema: {e}")
+            logger.error("Error fetching schema: %s", e)
             # Return common fields as fallback
-            return [
-                {'column_name': 'college_id', 'data_type': 'integer'},
-                {'column_name': 'name', 'data_type': 'text'},
-                {'column_name': 'city', 'data_type': 'text'},
-                {'column_name': 'state', 'data_type': 'text'},
-                {'column_name': 'year_of_established', 'data_type': 'integer'},
-                {'column_name': 'website', 'data_type': 'text'},
-                {'column_name': 'rankings', 'data_type': 'jsonb'},
-                {'column_name': 'accreditations', 'data_type': 'jsonb'},
-                {'column_name': 'degrees', 'data_type': 'jsonb'},
-                {'column_name': 'infrastructure', 'data_type': 'jsonb'},
-            ]
-
-    def get_field_groups(self) -> Dict[str, List[str]]:
+            return list(FALLBACK_SCHEMA)
+
+    def get_field_groups(self) -> Mapping[str, Tuple[str, ...]]:
         """
         Get predefined field groups for easy selection.
 
         Returns:
-            Dictionary mapping group names to field lists
+            Read-only mapping of group names to field tuples
         """
-        return {
-            'Basic Info': [
-                'college_id', 'name', 'city', 'state', 'district',
-                'year_of_established', 'website', 'college_is_active'
-            ],
-            'Rankings & Accreditation': [
-                'rankings', 'accreditations'
-            ],
-            'Academics & Programs': [
-                'degrees', 'faculty_ratio'  # Maps to 'faculty_student_ratio' in DB
-                # Note: 'fees' is not a separate column - fee information is in degrees JSON
-            ],
-            'Infrastructure & Facilities': [
-                'infrastructure', 'nearby_places', 'utilities'  # Maps to 'essential_utilities' in DB
-            ],
-            'Contact & Location': [
-                'contact_info', 'address', 'city', 'state', 'district'  # 'address' maps to 'full_address' in DB
-            ]
-            # Note: 'placements' and 'alumni' are not available in mvx_college_data_flattened view
-        }
+        return FIELD_GROUPS
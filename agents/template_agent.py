@@ -1,12 +1,18 @@
 """Template agent for creating content structure and outlines."""
 
 import logging
+import re
 from typing import Dict, Any, List
 from models.llm_interface import BaseLLM
 from utils.content_types import get_content_type_metadata
+from utils.llm_cache import cached_generate
 
 logger = logging.getLogger(__name__)
 
+# Classifies a stripped outline line by its leading characters: a section
+# marker ("1.", "12.", "##"), a dash item (subsection or point) or another bullet
+_OUTLINE_LINE_RE = re.compile(r'(?:(?P<section>\d.?\.|##)|(?P<dash>-)\s*(?P<lead>\S?)|(?P<bullet>[*•]))')
+
 
 class TemplateAgent:
     """Agent for generating content templates and outlines."""
@@ -25,7 +31,8 @@ class TemplateAgent:
         content_prompt: Dict[str, str],
         content_type: str,
         data_summary: str,
-        serp_context: str = ""
+        serp_context: str = "",
+        bust_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate a content template/outline.
@@ -35,6 +42,7 @@ class TemplateAgent:
             content_type: Type of content
             data_summary: Summary of available data
             serp_context: Context from SerpAPI (optional)
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             Template structure with sections and bullet points
@@ -106,10 +114,12 @@ FORMAT GUIDANCE:
 Format the outline clearly with hierarchical structure."""
 
         try:
-            response = self.llm.generate(
+            response = cached_generate(
+                self.llm,
                 prompt,
                 system_prompt=system_prompt,
-                temperature=0.6
+                temperature=0.6,
+                bust_cache=bust_cache
             )
 
             # Parse the outline
@@ -129,7 +139,7 @@ Format the outline clearly with hierarchical structure."""
             return template
 
         except Exception as e:
-            logger.error(f"Error generating template: {e}")
+            logger.error("Error generating template: %s", e)
             return {
                 "title": content_prompt['title'],
                 "sections": [],
@@ -159,8 +169,12 @@ Format the outline clearly with hierarchical structure."""
             if not line_stripped:
                 continue
 
+            match = _OUTLINE_LINE_RE.match(line_stripped)
+            if not match:
+                continue
+
             # Detect main sections (usually start with numbers or ##)
-            if (line_stripped[0].isdigit() and '.' in line_stripped[:3]) or line_stripped.startswith('##'):
+            if match['section']:
                 if current_section:
                     sections.append(current_section)
 
@@ -174,7 +188,7 @@ Format the outline clearly with hierarchical structure."""
                 current_subsection = None
 
             # Detect subsections
-            elif line_stripped.startswith('-') and line_stripped[1:].strip()[0].isupper():
+            elif match['dash'] and match['lead'].isupper():
                 subsection_title = line_stripped.lstrip('- ').strip()
                 current_subsection = {
                     "title": subsection_title,
@@ -184,7 +198,7 @@ Format the outline clearly with hierarchical structure."""
                     current_section["subsections"].append(current_subsection)
 
             # Detect bullet points
-            elif line_stripped.startswith('-') or line_stripped.startswith('*') or line_stripped.startswith('•'):
+            else:
                 point = line_stripped.lstrip('-*• ').strip()
 
                 if current_subsection:
@@ -243,7 +257,7 @@ Provide the refined outline with requested changes."""
             return refined_template
 
         except Exception as e:
-            logger.error(f"Error refining template: {e}")
+            logger.error("Error refining template: %s", e)
             return template
 
     def get_template_summary(self, template: Dict[str, Any]) -> str:
@@ -256,29 +270,30 @@ Provide the refined outline with requested changes."""
         Returns:
             Summary string
         """
-        summary = f"# {template.get('title', 'Content Outline')}\n\n"
-        summary += f"**Content Type:** {template.get('content_type', 'N/A')}\n\n"
+        parts = [
+            f"# {template.get('title', 'Content Outline')}\n\n",
+            f"**Content Type:** {template.get('content_type', 'N/A')}\n\n"
+        ]
+        append = parts.append
 
         metadata = template.get('metadata', {})
         if metadata:
-            summary += f"**Target Length:** {metadata.get('ideal_length', 'N/A')}\n"
-            summary += f"**Tone:** {metadata.get('tone', 'N/A')}\n\n"
+            append(f"**Target Length:** {metadata.get('ideal_length', 'N/A')}\n")
+            append(f"**Tone:** {metadata.get('tone', 'N/A')}\n\n")
 
-        summary += "## Outline:\n\n"
+        append("## Outline:\n\n")
 
         for i, section in enumerate(template.get('sections', []), 1):
-            summary += f"{i}. **{section['title']}**\n"
+            append(f"{i}. **{section['title']}**\n")
 
-            if section.get('points'):
-                for point in section['points']:
-                    summary += f"   - {point}\n"
+            for point in section.get('points') or ():
+                append(f"   - {point}\n")
 
-            if section.get('subsections'):
-                for subsection in section['subsections']:
-                    summary += f"   - {subsection['title']}\n"
-                    for point in subsection.get('points', []):
-                        summary += f"     • {point}\n"
+            for subsection in section.get('subsections') or ():
+                append(f"   - {subsection['title']}\n")
+                for point in subsection.get('points', []):
+                    append(f"     • {point}\n")
 
-            summary += "\n"
+            append("\n")
 
-        return summary
+        return "".join(parts)
@@ -1,12 +1,164 @@
 """Topic agent for generating content topics based on college data."""
 
+import json
 import logging
-from typing import List, Dict, Any
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Mapping, Tuple
 from models.llm_interface import BaseLLM
-from utils.content_types import get_content_type_metadata
+from utils.content_types import ContentType, get_content_type_metadata
+from utils.llm_cache import cached_generate
+from agents.prompts import get_prompt
 
 logger = logging.getLogger(__name__)
 
+# One pass per response line: a standalone "N." marker or a "Topic:"/"Focus:" field
+_TOPIC_LINE_RE = re.compile(
+    r'^(?:(?P<num>\d+)\.\s*|(?P<field>topic|focus)\s*:\s*(?P<value>.*))$',
+    re.IGNORECASE
+)
+# First characters that can begin a marker or field line; anything else is focus text
+_TOPIC_LINE_STARTS = frozenset('0123456789TtFf')
+_DIGITS = frozenset('0123456789')
+# Standalone "N." marker lines that separate topic blocks in well-formed responses
+_TOPIC_BLOCK_SPLIT_RE = re.compile(r'^[ \t]*\d+\.[ \t]*$', re.MULTILINE)
+# College names in summary lines like "- College Name in City, State"
+_COLLEGE_NAME_RE = re.compile(r'-\s+([^(]+?)\s+(?:in|,|\()')
+_DIGIT_RE = re.compile(r'\d')
+# Indian education terms, matched as substrings of the lowercased topic
+INDIAN_KEYWORDS = (
+    'nirf', 'naac', 'jee', 'neet', 'cat', 'clat', 'lakh', 'crore',
+    'lpa', 'btech', 'mba', 'mbbs', 'aicte', 'ugc'
+)
+_INDIAN_KEYWORD_RE = re.compile('|'.join(INDIAN_KEYWORDS))
+# Output tokens budgeted per content type in a topic batch, and the most one
+# call may request (stays under the 4096-token output cap of older models)
+TOPIC_TOKENS_PER_TYPE = 2000
+MAX_TOPIC_BATCH_TOKENS = 4000
+
+# Generic fallback topics, used when generation fails or yields nothing specific
+# (read-only; _get_default_topics hands out plain dict copies)
+DEFAULT_TOPICS: Tuple[Mapping[str, str], ...] = tuple(map(MappingProxyType, (
+    {
+        "topic": "Complete Admission Guide",
+        "focus": "Step-by-step guide covering eligibility, entrance exams, application process, and important dates"
+    },
+    {
+        "topic": "Rankings and Accreditations Analysis",
+        "focus": "Detailed breakdown of NIRF rankings, NAAC grades, and other quality certifications"
+    },
+    {
+        "topic": "Campus Infrastructure and Facilities",
+        "focus": "Comprehensive overview of labs, libraries, hostels, sports facilities, and amenities"
+    },
+    {
+        "topic": "Placement Records and Career Opportunities",
+        "focus": "Analysis of placement statistics, top recruiters, salary packages, and industry connections"
+    },
+    {
+        "topic": "Fees Structure and Scholarship Options",
+        "focus": "Complete breakdown of tuition fees, additional costs, and available financial aid"
+    },
+    {
+        "topic": "Student Life and Campus Culture",
+        "focus": "Insights into clubs, events, extracurricular activities, and student experiences"
+    },
+    {
+        "topic": "Academic Programs and Specializations",
+        "focus": "Overview of degree programs, courses offered, faculty expertise, and unique features"
+    },
+    {
+        "topic": "Location Advantages and Connectivity",
+        "focus": "Analysis of location benefits, nearby facilities, transportation, and accessibility"
+    }
+)))
+# Content types whose fallback topics differ from DEFAULT_TOPICS
+_DEFAULT_TOPICS_BY_TYPE: Mapping[str, Tuple[Mapping[str, str], ...]] = MappingProxyType({
+    ContentType.COMPARISON.value: tuple(map(MappingProxyType, (
+        {
+            "topic": "Rankings and Accreditations Comparison",
+            "focus": "Side-by-side NIRF ranks, NAAC grades, and other accreditations of the selected colleges"
+        },
+        {
+            "topic": "Fees and Scholarships Comparison",
+            "focus": "Tuition fees, hostel costs, and scholarship options compared program by program"
+        },
+        {
+            "topic": "Placement Comparison",
+            "focus": "Placement rates, average and highest packages, and top recruiters compared"
+        },
+        {
+            "topic": "Infrastructure and Facilities Comparison",
+            "focus": "Labs, libraries, hostels, and campus amenities compared across colleges"
+        },
+        {
+            "topic": "Admission Process Comparison",
+            "focus": "Entrance exams, eligibility, cutoffs, and application timelines compared"
+        },
+        {
+            "topic": "Which College Should You Choose?",
+            "focus": "Verdict and recommendations for different student priorities and budgets"
+        }
+    ))),
+    ContentType.FAQ_PAGE.value: tuple(map(MappingProxyType, (
+        {
+            "topic": "Admission FAQs",
+            "focus": "Common questions on eligibility, entrance exams, cutoffs, and application deadlines"
+        },
+        {
+            "topic": "Fees and Scholarships FAQs",
+            "focus": "Common questions on tuition fees, hostel charges, and financial aid"
+        },
+        {
+            "topic": "Placements FAQs",
+            "focus": "Common questions on placement rates, packages, and recruiting companies"
+        },
+        {
+            "topic": "Rankings and Accreditation FAQs",
+            "focus": "Common questions on NIRF ranks, NAAC grades, and UGC/AICTE approvals"
+        },
+        {
+            "topic": "Campus Life and Hostel FAQs",
+            "focus": "Common questions on hostels, facilities, clubs, and student life"
+        }
+    )))
+})
+
+
+def _match_topic_line(line: str) -> Optional[re.Match]:
+    """
+    Match a stripped, non-empty line against the marker/field pattern.
+
+    Character checks reject ordinary text before the regex runs: lines must
+    start like a marker or field, and digit-led lines must end with '.'
+    (prose such as "2024 placements..." never reaches the regex).
+    """
+    first = line[0]
+    if first not in _TOPIC_LINE_STARTS or (first in _DIGITS and line[-1] != '.'):
+        return None
+    return _TOPIC_LINE_RE.match(line)
+
+
+@lru_cache(maxsize=128)
+def _extract_college_names(college_data_summary: str) -> Tuple[str, ...]:
+    """Extract college names from a data summary, memoized per summary."""
+    names = []
+    # Look for patterns like "- College Name in City, State"
+    for match in _COLLEGE_NAME_RE.findall(college_data_summary):
+        name = match.strip()
+        if name and len(name) > 3:  # Avoid short matches
+            names.append(name)
+
+    logger.debug("Extracted %d college names: %s", len(names), names)
+    return tuple(names)
+
+
+@lru_cache(maxsize=128)
+def _lowercase_college_names(college_data_summary: str) -> Tuple[str, ...]:
+    """Lowercased college names of a data summary, for substring checks."""
+    return tuple(name.lower() for name in _extract_college_names(college_data_summary))
+
 
 class TopicAgent:
     """Agent for generating relevant content topics."""
@@ -24,7 +176,8 @@ class TopicAgent:
         self,
         college_data_summary: str,
         content_type: str,
-        num_topics: int = 8
+        num_topics: int = 8,
+        bust_cache: bool = False
     ) -> List[Dict[str, str]]:
         """
         Generate topic suggestions based on college data.
@@ -33,88 +186,37 @@ class TopicAgent:
             college_data_summary: Summary of college data available
             content_type: Type of content to generate
             num_topics: Number of topics to generate
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             List of topic dictionaries with title and description
         """
         metadata = get_content_type_metadata(content_type)
 
-        system_prompt = f"""You are an expert content strategist specializing in Indian higher education and college-related content.
-
-Your task is to generate {num_topics} diverse and engaging topic ideas for content creation.
-
-CRITICAL REQUIREMENTS - Each topic MUST:
-1. Be SPECIFIC to the actual college(s) data provided (use actual college names, rankings, fees, programs)
-2. Reference ACTUAL data points (specific NIRF ranks, NAAC grades, fees in lakhs, placement percentages, program names)
-3. Use INDIAN context: Indian English style, target Indian students/parents, reference Indian education system
-4. Align with the content type: {metadata.name}
-5. Be SEO-friendly with college name + specific aspect (e.g., "IIT Delhi Placements 2024")
-6. Be directly answerable using the provided data
-
-INDIAN CONTEXT:
-- Use Indian English (lakhs/crores instead of hundreds of thousands/millions)
-- Target Indian students and parents
-- Reference Indian education boards (CBSE, ICSE, State Boards)
-- Mention Indian entrance exams (JEE, NEET, CAT, CLAT, etc.)
-- Use Indian accreditation bodies (UGC, AICTE, NAAC, NIRF)
-- Use Indian terminology (college vs university, reservation categories, domicile)
-
-BAD EXAMPLES (too generic, avoid these):
-- "Complete Admission Guide"
-- "Rankings and Accreditations"
-- "Campus Infrastructure Overview"
-
-GOOD EXAMPLES (specific, data-driven):
-- "IIT Bombay NIRF Rank #1: Complete BTech Admission Guide for 2025 (JEE Advanced Cutoff, Fees ₹2.5 Lakhs)"
-- "MIT Manipal vs VIT Vellore: Placement Comparison 2024 (₹8.5 LPA vs ₹7.2 LPA Average CTC)"
-- "Top 5 Engineering Programs at NIT Trichy with 95%+ Placement Rate and ₹15 LPA Average Package"
-
-Tone: {metadata.tone}
-Ideal Length: {metadata.ideal_length}"""
-
-        prompt = f"""Based on the following college data, generate {num_topics} compelling topic ideas for {content_type} content:
-
-Available Data Summary:
-{college_data_summary}
-
-CRITICAL INSTRUCTIONS:
-1. Each topic MUST include the actual college name(s) from the data above
-2. Each topic MUST reference at least one specific data point (NIRF rank number, NAAC grade, fees in lakhs, placement %, program names)
-3. Topics should be DIRECT and SPECIFIC, not generic - use actual numbers and facts
-4. Use Indian English and Indian education context (JEE/NEET, lakhs/crores, NIRF/NAAC)
-5. Topics must be directly answerable using the provided college data
-
-Topic Focus Areas (use actual data for each):
-- Academic programs: Mention specific program names, duration, seats available
-- Rankings: Use actual NIRF ranks, NAAC grades from the data
-- Admissions: Reference actual entrance exams (JEE, NEET), eligibility criteria, cutoffs if available
-- Fees: Use actual fee amounts in lakhs from the data
-- Placements: Use actual placement percentages/packages in LPA from the data
-- Infrastructure: Mention specific facilities by name from the data
-- Location: Use actual city/state and nearby advantages from the data
-
-IMPORTANT: Format each topic EXACTLY like this:
-
-1.
-Topic: [College Name + Specific Aspect with Data Point]
-Focus: [Brief description mentioning specific details from data]
-
-2.
-Topic: [College Name + Specific Aspect with Data Point]
-Focus: [Brief description mentioning specific details from data]
-
-Generate all {num_topics} topics now:"""
+        system_prompt = get_prompt("topic").format(
+            name=metadata.name,
+            tone=metadata.tone,
+            ideal_length=metadata.ideal_length
+        )
+        prompt = get_prompt("topic_request").format(
+            num_topics=num_topics,
+            content_type=content_type,
+            college_data_summary=college_data_summary
+        )
 
         try:
-            response = self.llm.generate(
+            response = cached_generate(
+                self.llm,
                 prompt,
                 system_prompt=system_prompt,
                 temperature=0.8,  # Higher temperature for creativity
-                max_tokens=2000
+                max_tokens=2000,
+                bust_cache=bust_cache
             )
 
-            # Parse the response into structured topics
-            topics = self._parse_topics(response)
+            # Parse the JSON response, falling back to the "Topic:/Focus:" text
+            # format for models that ignore the JSON instruction
+            topics = self._parse_topics_json(response).get('topics') or self._parse_topics(response)
 
             # Validate topics for specificity
             validated_topics = self._validate_topic_specificity(topics, college_data_summary)
@@ -124,73 +226,164 @@ Generate all {num_topics} topics now:"""
                 logger.warning("No valid specific topics generated, using defaults")
                 return self._get_default_topics(content_type)
 
-            logger.info(f"Generated {len(validated_topics)} validated topic ideas")
+            logger.info("Generated %d validated topic ideas", len(validated_topics))
             return validated_topics
 
         except Exception as e:
-            logger.error(f"Error generating topics: {e}")
+            logger.error("Error generating topics: %s", e)
             # Return default topics if generation fails
             return self._get_default_topics(content_type)
 
-    def _parse_topics(self, response: str) -> List[Dict[str, str]]:
+    def generate_topics_batch(
+        self,
+        college_data_summary: str,
+        content_types: List[str],
+        num_topics: int = 8,
+        bust_cache: bool = False
+    ) -> Dict[str, List[Dict[str, str]]]:
         """
-        Parse LLM response into structured topics.
+        Generate topic suggestions for several content types in few LLM calls.
+
+        Each call covers as many types as fit in MAX_TOPIC_BATCH_TOKENS; the
+        college data is sent once per call and the LLM answers with a JSON
+        object keyed by content type. Types missing from the response, or left with
+        no specific topics after validation, fall back to the default topics.
 
         Args:
-            response: LLM response text
+            college_data_summary: Summary of college data available
+            content_types: Types of content to generate topics for
+            num_topics: Number of topics to generate per content type
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
-            List of topic dictionaries
+            Dictionary mapping each content type to its list of topic dictionaries
         """
-        import re
+        content_types = list(dict.fromkeys(content_types))
+
+        # Keep each call's output budget under the smallest provider cap
+        types_per_call = max(1, MAX_TOPIC_BATCH_TOKENS // TOPIC_TOKENS_PER_TYPE)
+        topics_by_type = {}
+        for i in range(0, len(content_types), types_per_call):
+            topics_by_type.update(self._generate_topics_chunk(
+                college_data_summary,
+                content_types[i:i + types_per_call],
+                num_topics,
+                bust_cache
+            ))
+
+        results = {}
+        for content_type in content_types:
+            topics = topics_by_type.get(content_type.strip().lower(), [])
+            validated_topics = self._validate_topic_specificity(topics, college_data_summary)
 
-        logger.debug(f"Parsing topics from response (length: {len(response)})")
-        logger.debug(f"Response preview:\n{response[:500]}")
+            if not validated_topics:
+                logger.warning("No valid specific topics generated for %s, using defaults", content_type)
+                validated_topics = self._get_default_topics(content_type)
 
-        topics = []
-        current_topic = {}
-        lines = response.split('\n')
+            results[content_type] = validated_topics
 
-        for line in lines:
-            line = line.strip()
+        return results
 
-            if not line:
-                continue
+    def _generate_topics_chunk(
+        self,
+        college_data_summary: str,
+        content_types: List[str],
+        num_topics: int,
+        bust_cache: bool
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Request topics for a few content types in one LLM call.
 
-            # Check for numbered topics (e.g., "1.", "2.", etc.) - must be standalone
-            if re.match(r'^\d+\.\s*$', line):
-                # Save previous topic if exists
-                if current_topic and 'topic' in current_topic:
-                    topics.append(current_topic)
-                    logger.debug(f"Added topic: {current_topic.get('topic', 'No topic')}")
-                current_topic = {}
-                continue
+        Args:
+            college_data_summary: Summary of college data available
+            content_types: Types of content to generate topics for
+            num_topics: Number of topics to generate per content type
+            bust_cache: Bypass the response cache for identical requests
 
-            # Extract topic (case insensitive, flexible formatting)
-            topic_match = re.match(r'^topic\s*:\s*(.+)', line, re.IGNORECASE)
-            if topic_match:
-                topic = topic_match.group(1).strip()
-                current_topic['topic'] = topic
-                logger.debug(f"Found topic: {topic}")
-                continue
+        Returns:
+            Parsed topics keyed by lowercased content type; empty on failure
+        """
+        metadata = [get_content_type_metadata(content_type) for content_type in content_types]
+
+        system_prompt = get_prompt("topic").format(
+            name=", ".join(m.name for m in metadata),
+            tone="; ".join(f"{m.name}: {m.tone}" for m in metadata),
+            ideal_length="; ".join(f"{m.name}: {m.ideal_length}" for m in metadata)
+        )
+        prompt = get_prompt("topic_batch_request").format(
+            num_topics=num_topics,
+            content_types=", ".join(content_types),
+            college_data_summary=college_data_summary
+        )
+
+        try:
+            response = cached_generate(
+                self.llm,
+                prompt,
+                system_prompt=system_prompt,
+                temperature=0.8,  # Higher temperature for creativity
+                max_tokens=min(MAX_TOPIC_BATCH_TOKENS, TOPIC_TOKENS_PER_TYPE * len(content_types)),
+                bust_cache=bust_cache
+            )
+            return self._parse_topics_json(response)
 
-            # Extract focus (case insensitive, flexible formatting)
-            focus_match = re.match(r'^focus\s*:\s*(.+)', line, re.IGNORECASE)
-            if focus_match:
-                focus = focus_match.group(1).strip()
-                current_topic['focus'] = focus
-                logger.debug(f"Found focus: {focus[:50]}...")
+        except Exception as e:
+            logger.error("Error generating topic batch: %s", e)
+            return {}
+
+    def _parse_topics_json(self, response: str) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Parse a JSON topic response.
+
+        Args:
+            response: LLM response text, possibly wrapped in prose or code fences
+
+        Returns:
+            Dictionary mapping each lowercased key (a content type, or "topics"
+            for single requests) to its topic dictionaries; empty if the
+            response holds no usable JSON object
+        """
+        start, end = response.find('{'), response.rfind('}')
+        try:
+            parsed = json.loads(response[start:end + 1]) if 0 <= start < end else None
+        except ValueError as e:
+            logger.warning("Could not parse topic JSON: %s", e)
+            parsed = None
+
+        if not isinstance(parsed, dict):
+            logger.warning("No JSON object found in topic response")
+            return {}
+
+        topics_by_type = {}
+        for content_type, items in parsed.items():
+            if not isinstance(items, list):
                 continue
+            topics_by_type[str(content_type).strip().lower()] = [
+                {
+                    "topic": str(item['topic']).strip(),
+                    "focus": str(item.get('focus') or 'General overview of college information').strip()
+                }
+                for item in items
+                if isinstance(item, dict) and item.get('topic')
+            ]
+
+        logger.info("Parsed %d topic lists from JSON", len(topics_by_type))
+        return topics_by_type
 
-            # Append multi-line focus (if we already have focus and line doesn't start with topic/focus)
-            if current_topic and 'focus' in current_topic:
-                if not re.match(r'^(topic|focus)\s*:', line, re.IGNORECASE):
-                    current_topic['focus'] += ' ' + line
+    def _parse_topics(self, response: str) -> List[Dict[str, str]]:
+        """
+        Parse LLM response into structured topics.
 
-        # Add last topic
-        if current_topic and 'topic' in current_topic:
-            topics.append(current_topic)
-            logger.debug(f"Added final topic: {current_topic.get('topic', 'No topic')}")
+        Args:
+            response: LLM response text
+
+        Returns:
+            List of topic dictionaries
+        """
+        logger.debug("Parsing topics from response (length: %d)", len(response))
+        logger.debug("Response preview:\n%s", response[:500])
+
+        topics = self._parse_topic_blocks(response) or self._parse_topic_lines(response)
 
         # Clean up and ensure all topics have required fields
         cleaned_topics = []
@@ -200,7 +393,7 @@ Generate all {num_topics} topics now:"""
                 "focus": t.get('focus', 'General overview of college information')
             })
 
-        logger.info(f"Successfully parsed {len(cleaned_topics)} topics")
+        logger.info("Successfully parsed %d topics", len(cleaned_topics))
 
         # If parsing failed completely, log the full response for debugging
         if len(cleaned_topics) == 0:
@@ -209,6 +402,101 @@ Generate all {num_topics} topics now:"""
 
         return cleaned_topics
 
+    def _parse_topic_blocks(self, response: str) -> List[Dict[str, str]]:
+        """
+        Fast path: parse a well-formed response one numbered block at a time.
+
+        Each block must open with a "Topic:" line followed by a "Focus:" line;
+        any further lines continue the focus. Returns an empty list as soon as
+        a block does not fit, so the caller can fall back to the line parser.
+
+        Args:
+            response: LLM response text
+
+        Returns:
+            List of topic dictionaries, or empty list if the response is malformed
+        """
+        preamble, *blocks = _TOPIC_BLOCK_SPLIT_RE.split(response)
+        if not blocks or any(_match_topic_line(line.strip()) for line in preamble.splitlines() if line.strip()):
+            return []
+
+        topics = []
+        for block in blocks:
+            lines = [line.strip() for line in block.splitlines() if line.strip()]
+            if len(lines) < 2:
+                return []
+
+            topic_match, focus_match, *rest = map(_match_topic_line, lines)
+            if (
+                not topic_match or (topic_match['field'] or '').lower() != 'topic'
+                or not focus_match or (focus_match['field'] or '').lower() != 'focus'
+                or not topic_match['value'] or not focus_match['value']
+                or any(rest)
+            ):
+                return []
+
+            topics.append({
+                'topic': topic_match['value'],
+                'focus': ' '.join([focus_match['value'], *lines[2:]])
+            })
+
+        logger.debug("Parsed %d topics from numbered blocks", len(topics))
+        return topics
+
+    def _parse_topic_lines(self, response: str) -> List[Dict[str, str]]:
+        """
+        Parse a response line by line, tolerating malformed numbering and fields.
+
+        Args:
+            response: LLM response text
+
+        Returns:
+            List of raw topic dictionaries
+        """
+        topics = []
+        current_topic = {}
+        # Focus text of the current topic, joined once when the topic closes
+        focus_parts: List[str] = []
+
+        for line in response.splitlines():
+            line = line.strip()
+
+            if not line:
+                continue
+
+            match = _match_topic_line(line)
+            if match:
+                # Numbered marker (e.g., "1.", "2.") starts a new topic
+                if match['num']:
+                    # Save previous topic if exists
+                    if 'topic' in current_topic:
+                        if focus_parts:
+                            current_topic['focus'] = ' '.join(focus_parts)
+                        topics.append(current_topic)
+                        logger.debug("Added topic: %s", current_topic['topic'])
+                    current_topic = {}
+                    focus_parts = []
+                # Topic/focus field (case insensitive, flexible formatting)
+                elif match['value']:
+                    if match['field'].lower() == 'focus':
+                        focus_parts = [match['value']]
+                    else:
+                        current_topic['topic'] = match['value']
+                continue
+
+            # Append multi-line focus (if we already have focus)
+            if focus_parts:
+                focus_parts.append(line)
+
+        # Add last topic
+        if 'topic' in current_topic:
+            if focus_parts:
+                current_topic['focus'] = ' '.join(focus_parts)
+            topics.append(current_topic)
+            logger.debug("Added final topic: %s", current_topic['topic'])
+
+        return topics
+
     def _extract_college_names(self, college_data_summary: str) -> List[str]:
         """
         Extract college names from data summary.
@@ -219,18 +507,7 @@ Generate all {num_topics} topics now:"""
         Returns:
             List of college names
         """
-        import re
-
-        names = []
-        # Look for patterns like "- College Name in City, State"
-        matches = re.findall(r'-\s+([^(]+?)\s+(?:in|,|\()', college_data_summary)
-        for match in matches:
-            name = match.strip()
-            if name and len(name) > 3:  # Avoid short matches
-                names.append(name)
-
-        logger.debug(f"Extracted {len(names)} college names: {names}")
-        return names
+        return list(_extract_college_names(college_data_summary))
 
     def _validate_topic_specificity(
         self,
@@ -247,13 +524,11 @@ Generate all {num_topics} topics now:"""
         Returns:
             List of validated topics
         """
-        import re
-
         if not topics:
             return []
 
-        # Extract college names from data
-        college_names = self._extract_college_names(college_data_summary)
+        # Extract college names from data, lowercased once per summary
+        college_names = _lowercase_college_names(college_data_summary)
 
         validated = []
         rejected = []
@@ -262,35 +537,29 @@ Generate all {num_topics} topics now:"""
             topic_text = topic['topic']
             topic_lower = topic_text.lower()
 
-            # Check 1: Does topic mention at least one college name?
-            mentions_college = any(
-                name.lower() in topic_lower
-                for name in college_names
-                if len(name) > 3
-            )
-
-            # Check 2: Does topic contain numbers (rankings, fees, percentages)?
-            has_numbers = bool(re.search(r'\d+', topic_text))
+            # Topic is valid if it meets at least 2 of 3 criteria. The single-regex
+            # checks run first so the per-name scan is skipped once 2 are met.
+            # Check 1: Does topic contain numbers (rankings, fees, percentages)?
+            score = bool(_DIGIT_RE.search(topic_text))
 
-            # Check 3: Does topic contain Indian context keywords?
-            indian_keywords = ['nirf', 'naac', 'jee', 'neet', 'cat', 'clat', 'lakh', 'crore',
-                             'lpa', 'btech', 'mba', 'mbbs', 'aicte', 'ugc']
-            has_indian_context = any(keyword in topic_lower for keyword in indian_keywords)
+            # Check 2: Does topic contain Indian context keywords?
+            score += bool(_INDIAN_KEYWORD_RE.search(topic_lower))
 
-            # Topic is valid if it meets at least 2 of 3 criteria
-            score = sum([mentions_college, has_numbers, has_indian_context])
+            # Check 3: Does topic mention at least one college name?
+            if score < 2:
+                score += any(name in topic_lower for name in college_names)
 
             if score >= 2:
                 validated.append(topic)
-                logger.debug(f"✓ Validated topic (score {score}/3): {topic_text[:60]}")
+                logger.debug("✓ Validated topic: %s", topic_text[:60])
             else:
                 rejected.append(topic_text)
-                logger.debug(f"✗ Rejected generic topic (score {score}/3): {topic_text[:60]}")
+                logger.debug("✗ Rejected generic topic (score %d/3): %s", score, topic_text[:60])
 
         # Log summary
         if rejected:
-            logger.info(f"Rejected {len(rejected)} generic topics: {rejected[:3]}")
-        logger.info(f"Validated {len(validated)}/{len(topics)} topics as specific")
+            logger.info("Rejected %d generic topics: %s", len(rejected), rejected[:3])
+        logger.info("Validated %d/%d topics as specific", len(validated), len(topics))
 
         return validated
 
@@ -304,45 +573,13 @@ Generate all {num_topics} topics now:"""
         Returns:
             List of default topics
         """
-        return [
-            {
-                "topic": "Complete Admission Guide",
-                "focus": "Step-by-step guide covering eligibility, entrance exams, application process, and important dates"
-            },
-            {
-                "topic": "Rankings and Accreditations Analysis",
-                "focus": "Detailed breakdown of NIRF rankings, NAAC grades, and other quality certifications"
-            },
-            {
-                "topic": "Campus Infrastructure and Facilities",
-                "focus": "Comprehensive overview of labs, libraries, hostels, sports facilities, and amenities"
-            },
-            {
-                "topic": "Placement Records and Career Opportunities",
-                "focus": "Analysis of placement statistics, top recruiters, salary packages, and industry connections"
-            },
-            {
-                "topic": "Fees Structure and Scholarship Options",
-                "focus": "Complete breakdown of tuition fees, additional costs, and available financial aid"
-            },
-            {
-                "topic": "Student Life and Campus Culture",
-                "focus": "Insights into clubs, events, extracurricular activities, and student experiences"
-            },
-            {
-                "topic": "Academic Programs and Specializations",
-                "focus": "Overview of degree programs, courses offered, faculty expertise, and unique features"
-            },
-            {
-                "topic": "Location Advantages and Connectivity",
-                "focus": "Analysis of location benefits, nearby facilities, transportation, and accessibility"
-            }
-        ]
+        return [dict(topic) for topic in _DEFAULT_TOPICS_BY_TYPE.get(content_type, DEFAULT_TOPICS)]
 
     def refine_topic(
         self,
         selected_topic: Dict[str, str],
-        user_input: str
+        user_input: str,
+        bust_cache: bool = False
     ) -> Dict[str, str]:
         """
         Refine a topic based on user input.
@@ -350,6 +587,7 @@ Generate all {num_topics} topics now:"""
         Args:
             selected_topic: The topic selected by user
             user_input: User's custom input or modifications
+            bust_cache: Bypass the response cache for identical requests
 
         Returns:
             Refined topic
@@ -368,10 +606,12 @@ User Input/Modifications:
 Provide the refined topic with updated title and focus area."""
 
         try:
-            response = self.llm.generate(
+            response = cached_generate(
+                self.llm,
                 prompt,
                 system_prompt=system_prompt,
-                temperature=0.7
+                temperature=0.7,
+                bust_cache=bust_cache
             )
 
             # Parse refined topic
@@ -383,5 +623,5 @@ Provide the refined topic with updated title and focus area."""
                 return selected_topic
 
         except Exception as e:
-            logger.error(f"Error refining topic: {e}")
+            logger.error("Error refining topic: %s", e)
             return selected_topic
@@ -1,28 +1,39 @@
 """Main Streamlit application for content generation."""
 
 import streamlit as st
+import copy
+import hashlib
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Tuple
+from dotenv import load_dotenv
 
-# Configure logging
+load_dotenv()
+
+# Configure logging; set LOG_LEVEL=DEBUG for troubleshooting
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for better troubleshooting
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# HTTP and SDK clients log every request; keep them to warnings at any app level
+for noisy_logger in ("httpx", "httpcore", "urllib3", "openai", "anthropic"):
+    logging.getLogger(noisy_logger).setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-# Import modules
-from models.llm_factory import LLMFactory
-from database.connection import DatabaseConnection
-from agents.simple_query_agent import SimpleQueryAgent
-from agents.topic_agent import TopicAgent
-from agents.template_agent import TemplateAgent
-from agents.content_agent import ContentAgent
-from utils.serpapi_helper import SerpAPIHelper
+# Import modules. The LLM SDKs, psycopg2 and SerpAPI client are only needed once
+# the system is initialized, so the modules that pull them in are imported there.
 from utils.content_types import get_content_type_options, get_content_type_display_names
 from utils.college_data_display import display_college_data_preview
 from utils.keyword_parser import KeywordParser
 from config.llm_config import MODEL_OPTIONS
+from config.database import COLLEGE_DATA_VIEW
+
+if TYPE_CHECKING:
+    from database.connection import DatabaseConnection
 
 # Page configuration
 st.set_page_config(
@@ -94,245 +105,602 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-
-def initialize_session_state():
-    """Initialize Streamlit session state variables."""
-    if 'llm' not in st.session_state:
-        st.session_state.llm = None
-    if 'db' not in st.session_state:
-        st.session_state.db = None
-    if 'query_agent' not in st.session_state:
-        st.session_state.query_agent = None
-    if 'topic_agent' not in st.session_state:
-        st.session_state.topic_agent = None
-    if 'template_agent' not in st.session_state:
-        st.session_state.template_agent = None
-    if 'content_agent' not in st.session_state:
-        st.session_state.content_agent = None
-    if 'serp_helper' not in st.session_state:
-        st.session_state.serp_helper = None
+# Session state keys and their initial values
+SESSION_DEFAULTS = {
+    # System components
+    'llm': None,
+    'db': None,
+    'query_agent': None,
+    'topic_agent': None,
+    'template_agent': None,
+    'content_agent': None,
+    'serp_helper': None,
 
     # College selection
-    if 'colleges_list' not in st.session_state:
-        st.session_state.colleges_list = []
-    if 'selected_college' not in st.session_state:
-        st.session_state.selected_college = None
-    if 'selected_college_ids' not in st.session_state:
-        st.session_state.selected_college_ids = []
-    if 'comparison_colleges_list' not in st.session_state:
-        st.session_state.comparison_colleges_list = []  # List of {id, name, city, state}
-    if 'selected_fields' not in st.session_state:
-        st.session_state.selected_fields = None
-    if 'user_keywords' not in st.session_state:
-        st.session_state.user_keywords = []
+    'colleges_list': [],
+    'selected_college': None,
+    'selected_college_ids': [],
+    'comparison_colleges_list': [],  # List of {id, name, city, state}
+    'selected_fields': None,
+    'user_keywords': [],
 
     # Workflow state
-    if 'data_fetched' not in st.session_state:
-        st.session_state.data_fetched = False
-    if 'topics_generated' not in st.session_state:
-        st.session_state.topics_generated = False
-    if 'template_generated' not in st.session_state:
-        st.session_state.template_generated = False
-    if 'content_generated' not in st.session_state:
-        st.session_state.content_generated = False
+    'data_fetched': False,
+    'topics_generated': False,
+    'template_generated': False,
+    'content_generated': False,
 
     # Data storage
-    if 'fetched_data' not in st.session_state:
-        st.session_state.fetched_data = None
-    if 'generated_topics' not in st.session_state:
-        st.session_state.generated_topics = []
-    if 'selected_topic' not in st.session_state:
-        st.session_state.selected_topic = None
-    if 'user_prompt' not in st.session_state:
-        st.session_state.user_prompt = ""
-    if 'template' not in st.session_state:
-        st.session_state.template = None
-    if 'final_content' not in st.session_state:
-        st.session_state.final_content = ""
+    'fetched_data': None,
+    'generated_topics': [],
+    'selected_topic': None,
+    'user_prompt': "",
+    'template': None,
+    'final_content': "",
+}
+
+# Predefined prompt templates for Step 3, keyed by their selectbox label
+PROMPT_TEMPLATES = {
+    "Custom (Write your own)": "",
+    "Comprehensive College Guide": """Write a comprehensive guide about the college(s) in the dataset. The content should include:
+
+1. Overview and Introduction: Brief history, establishment year, location highlights
+2. Academic Excellence: Top programs, accreditations, rankings (NIRF, NAAC)
+3. Admission Process: Eligibility criteria, entrance exams, application procedures, important dates
+4. Fees Structure: Detailed breakdown by program, scholarship opportunities
+5. Infrastructure & Facilities: Campus amenities, library, labs, hostels, sports facilities
+6. Placements & Career: Average packages, top recruiters, placement statistics
+7. Student Life: Clubs, events, cultural activities
+8. Contact Information: Address, phone, email, website
+
+Target audience: Students and parents making informed decisions about higher education.
+Tone: Professional yet approachable, factual with engaging narrative.""",
+
+    "Comparison & Rankings Focus": """Create a detailed comparison and ranking analysis of the college(s):
+
+1. Rankings Analysis: Break down NIRF rankings, NAAC grades, and other accreditations
+2. Program Comparisons: Compare similar programs across metrics (fees, duration, seats)
+3. Competitive Analysis: Position relative to other colleges in the region
+4. Strengths & Weaknesses: Honest assessment of what makes these colleges stand out
+5. Best For: Recommendations for different student profiles
+6. Value Proposition: ROI analysis considering fees vs. placement outcomes
+
+Include data-driven insights, statistics, and comparative tables where relevant.
+Tone: Analytical, objective, data-focused.""",
+
+    "Admission & Career Guide": """Develop a practical guide focused on admissions and career outcomes:
+
+1. Admission Strategy: Step-by-step application guide, important deadlines
+2. Entrance Exam Preparation: Required exams, cutoffs, preparation tips
+3. Eligibility Requirements: Academic qualifications, age limits, reservation criteria
+4. Career Opportunities: Industry connections, internship programs
+5. Placement Track Record: Year-wise placement data, sector-wise distribution
+6. Alumni Network: Notable alumni, career trajectories
+7. Industry Partnerships: Corporate tie-ups, training programs
+
+Target audience: Aspiring students preparing for admissions.
+Tone: Action-oriented, motivational, practical.""",
+
+    "Structured Query Expansion": """Analyze the college(s) data and expand the content across multiple dimensions:
+
+CONTENT DIMENSIONS:
+1. Factual Information: Establish year, location, governance type, affiliations
+2. Academic Portfolio: Programs offered, specializations, unique courses
+3. Infrastructure Deep-dive: Physical facilities, digital infrastructure, accessibility
+4. Financial Aspects: Fees structure, payment plans, scholarships, financial aid
+5. Quality Metrics: Accreditations, certifications, compliance standards
+6. Student Experience: Campus life, diversity, support services
+7. Career Pathways: Placement cell, industry connections, entrepreneurship support
+
+TRANSFORMATION TYPES:
+- Core Facts: Direct information from database
+- Comparative Insights: How it compares with peer institutions
+- Implicit Details: What prospective students typically want to know
+- Entity Expansions: Detailed breakdowns of programs, facilities, etc.
+- User Intent Matching: Address common questions and concerns
+
+Provide comprehensive coverage with proper structure, headings, and data-backed claims.
+Tone: Systematic, thorough, information-rich."""
+}
+
+# Content type choices for Step 1; fixed for the life of the process
+CONTENT_TYPE_OPTIONS = tuple(get_content_type_options())
+CONTENT_TYPE_DISPLAY_NAMES = get_content_type_display_names()
+
+# College search by name, city or state; the term is bound as a '%term%'
+# pattern (once per column), never interpolated into the SQL. ILIKE on the bare
+# columns lets the pg_trgm indexes described in CLAUDE.md serve the leading wildcard.
+COLLEGE_SEARCH_FILTER = """
+    college_is_active = true
+    AND (
+        name ILIKE %s
+        OR city ILIKE %s
+        OR state ILIKE %s
+    )
+"""
+
+COLLEGE_SEARCH_COUNT_QUERY = f"""
+    SELECT COUNT(*) as total
+    FROM {COLLEGE_DATA_VIEW}
+    WHERE {COLLEGE_SEARCH_FILTER};
+"""
+
+# LIMIT NULL returns every row
+COLLEGE_SEARCH_QUERY = f"""
+    SELECT college_id, name as college_name, city, state
+    FROM {COLLEGE_DATA_VIEW}
+    WHERE {COLLEGE_SEARCH_FILTER}
+    ORDER BY name
+    LIMIT %s;
+"""
+
+
+def college_search_params(search_term: str) -> tuple:
+    """
+    Build the parameters for COLLEGE_SEARCH_FILTER.
+
+    Args:
+        search_term: Text typed by the user
+
+    Returns:
+        Tuple of the match pattern for name, city and state
+    """
+    pattern = f"%{search_term.lower()}%"
+    return (pattern, pattern, pattern)
+
+
+# Streamlit reruns the script on every keystroke; these keep recent searches in
+# memory so retyping or backspacing over a term does not go back to the database.
+# Callers pass the term lowercased so case variants share one entry.
+@st.cache_data(ttl=60, show_spinner=False)
+def count_matching_colleges(_db: "DatabaseConnection", search_term: str) -> int:
+    """
+    Count active colleges whose name, city or state contains the search term.
+
+    Args:
+        _db: Database connection manager (excluded from the cache key)
+        search_term: Lowercased search term
+
+    Returns:
+        Number of matching colleges
+    """
+    count_result = _db.execute_query(COLLEGE_SEARCH_COUNT_QUERY, college_search_params(search_term))
+    return count_result[0]['total'] if count_result else 0
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def search_colleges(_db: "DatabaseConnection", search_term: str, limit=None) -> list:
+    """
+    Search active colleges by name, city or state.
+
+    Args:
+        _db: Database connection manager (excluded from the cache key)
+        search_term: Lowercased search term
+        limit: Maximum number of colleges to return (None for all)
+
+    Returns:
+        List of dictionaries with college_id, college_name, city and state
+    """
+    return _db.execute_query(COLLEGE_SEARCH_QUERY, college_search_params(search_term) + (limit,))
+
+
+def college_choices(slot: str, cache_key: tuple, colleges: list) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """
+    Get the labels and ids for a college selectbox, formatting them once per result set.
+
+    Args:
+        slot: Session state key the choices are kept under
+        cache_key: Identifies the result set (e.g., search term and limit)
+        colleges: Colleges with college_id, college_name, city and state
+
+    Returns:
+        Parallel tuples of "Name - City, State" labels and college ids
+    """
+    cached = st.session_state.get(slot)
+    if cached is None or cached[0] != cache_key:
+        labels = tuple(f"{c['college_name']} - {c['city']}, {c['state']}" for c in colleges)
+        ids = tuple(c['college_id'] for c in colleges)
+        cached = (cache_key, labels, ids)
+        st.session_state[slot] = cached
+    return cached[1], cached[2]
+
+
+def serialize_fetched_data(limit=None) -> str:
+    """
+    Serialize the fetched college records as compact JSON for an LLM prompt.
+
+    The LLM does not need indentation, so the compact form keeps the prompt
+    small. The result is kept in session state for the current fetch, so
+    repeated template or content clicks do not serialize the records again.
+
+    Args:
+        limit: Number of records to include (None for all)
+
+    Returns:
+        JSON string of the records
+    """
+    fetched_data = st.session_state.fetched_data
+    cached = st.session_state.get('_serialized_data')
+    # Keyed on the fetched data object itself (kept alive here, unlike a bare id()),
+    # so a new fetch always serializes again
+    if cached is None or cached[0] is not fetched_data:
+        cached = (fetched_data, {})
+        st.session_state._serialized_data = cached
+
+    serialized = cached[1].get(limit)
+    if serialized is None:
+        records = fetched_data['data'] if limit is None else fetched_data['data'][:limit]
+        serialized = json.dumps(records, separators=(',', ':'), default=str)
+        cached[1][limit] = serialized
+    return serialized
+
+
+def get_serp_context() -> str:
+    """
+    Get SerpAPI context for the current prompt.
+
+    Steps 4 and 5 both need it, so it is fetched once per prompt and reused.
+
+    Returns:
+        Formatted context string, or "" when SerpAPI is not configured
+    """
+    if not st.session_state.serp_helper:
+        return ""
+
+    prompt = st.session_state.user_prompt
+    cached = st.session_state.get('_serp_context')
+    if cached is None or cached[0] != prompt:
+        cached = (prompt, st.session_state.serp_helper.get_context_for_llm(prompt))
+        st.session_state._serp_context = cached
+    return cached[1]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_colleges(_db: "DatabaseConnection") -> list:
+    """
+    Load the active colleges shown in the "Select from List" dropdown.
+
+    The list is the same for every user and rarely changes, so it is cached
+    for an hour and shared across sessions.
+
+    Args:
+        _db: Database connection manager (excluded from the cache key)
+
+    Returns:
+        List of dictionaries with college_id, college_name, city and state
+    """
+    return _db.execute_query(f"""
+        SELECT college_id, name as college_name, city, state
+        FROM {COLLEGE_DATA_VIEW}
+        WHERE college_is_active = true
+        ORDER BY name
+        LIMIT 100;
+    """)
+
+
+# Seconds to wait for the connection tests run during initialization
+CONNECTION_TEST_TIMEOUT = 15
+
+
+def run_connection_tests(checks: Dict[str, Callable[[], bool]]) -> Dict[str, bool]:
+    """
+    Run independent connection tests in parallel.
+
+    Each test is a blocking network round trip, so running them on threads
+    makes initialization take as long as the slowest test instead of their sum.
+
+    Args:
+        checks: Test callables keyed by service name
+
+    Returns:
+        Test results keyed by service name; a test that raises or does not
+        finish within CONNECTION_TEST_TIMEOUT counts as failed
+    """
+    executor = ThreadPoolExecutor(max_workers=len(checks))
+    futures = {name: executor.submit(check) for name, check in checks.items()}
+    results = {}
+    try:
+        done, _ = wait(futures.values(), timeout=CONNECTION_TEST_TIMEOUT)
+        for name, future in futures.items():
+            if future not in done:
+                logger.error("%s connection test timed out after %ss", name, CONNECTION_TEST_TIMEOUT)
+                results[name] = False
+                continue
+            try:
+                results[name] = bool(future.result())
+            except Exception as e:
+                logger.error("%s connection test failed: %s", name, e)
+                results[name] = False
+    finally:
+        # Do not block the rerun on a test that timed out
+        executor.shutdown(wait=False)
+    return results
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm(provider: str, model_name: str, api_key_hash: str, temperature: float,
+            max_tokens: int, _api_key: str):
+    """
+    Get an LLM client shared across reruns and sessions with the same configuration.
+
+    Args:
+        provider: LLM provider key (e.g., "openai")
+        model_name: Model identifier
+        api_key_hash: SHA-256 of the API key; the cache key, so the plaintext key is never hashed into it
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens per response
+        _api_key: API key (underscore-prefixed, so excluded from the cache key)
+
+    Returns:
+        LLM instance
+    """
+    from models.llm_factory import LLMFactory
+
+    return LLMFactory.create_from_params(
+        provider=provider,
+        api_key=_api_key,
+        model_name=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_db() -> "DatabaseConnection":
+    """Get the database connection manager shared across reruns and sessions."""
+    from database.connection import DatabaseConnection
+
+    return DatabaseConnection()
+
+
+@st.cache_resource(show_spinner=False)
+def get_agents(llm_key: str, _llm, _db: "DatabaseConnection") -> dict:
+    """
+    Get the agents for an LLM client, shared across reruns and sessions.
+
+    Args:
+        llm_key: Cache key identifying the LLM configuration
+        _llm: LLM instance (excluded from the cache key)
+        _db: Database connection manager (excluded from the cache key)
+
+    Returns:
+        Dictionary of agents keyed by their session state name
+    """
+    from agents.simple_query_agent import SimpleQueryAgent
+    from agents.topic_agent import TopicAgent
+    from agents.template_agent import TemplateAgent
+    from agents.content_agent import ContentAgent
+
+    return {
+        "query_agent": SimpleQueryAgent(_llm, _db),
+        "topic_agent": TopicAgent(_llm),
+        "template_agent": TemplateAgent(_llm),
+        "content_agent": ContentAgent(_llm),
+    }
+
+
+def initialize_session_state():
+    """Initialize Streamlit session state variables."""
+    # Every key is set together, so one marker check covers later reruns
+    if '_session_initialized' in st.session_state:
+        return
+
+    for key, default in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            # Copy so sessions never share a mutable default
+            st.session_state[key] = copy.copy(default)
+    st.session_state._session_initialized = True
 
 
 def sidebar_configuration():
     """Render sidebar configuration."""
+    # Fragments cannot write into st.sidebar, so the container is opened outside the fragment
     with st.sidebar:
-        st.markdown("## ⚙️ Configuration")
-
-        # LLM Provider Selection
-        st.markdown("### LLM Provider")
-        provider_options = list(MODEL_OPTIONS.keys())
-        selected_provider = st.selectbox(
-            "Choose Provider",
-            provider_options,
-            key="provider_select"
-        )
+        sidebar_controls()
 
-        # Model Selection
-        model_options = MODEL_OPTIONS[selected_provider]
-        selected_model_name = st.selectbox(
-            "Choose Model",
-            list(model_options.keys()),
-            key="model_select"
-        )
-        selected_model = model_options[selected_model_name]
-
-        # API Key Input
-        api_key = st.text_input(
-            f"{selected_provider} API Key",
-            type="password",
-            key="api_key_input",
-            help="Enter your API key. It will only be stored in session memory."
-        )
 
-        # LLM Parameters
-        with st.expander("Advanced Settings"):
-            temperature = st.slider(
-                "Temperature",
-                min_value=0.0,
-                max_value=1.0,
-                value=0.7,
-                step=0.1,
-                help="Higher values make output more creative"
-            )
+@st.fragment
+def sidebar_controls():
+    """Render the sidebar controls; widget changes rerun only this fragment."""
+    st.markdown("## ⚙️ Configuration")
 
-            max_tokens = st.number_input(
-                "Max Tokens",
-                min_value=500,
-                max_value=8000,
-                value=4000,
-                step=500
-            )
+    # LLM Provider Selection
+    st.markdown("### LLM Provider")
+    provider_options = list(MODEL_OPTIONS.keys())
+    selected_provider = st.selectbox(
+        "Choose Provider",
+        provider_options,
+        key="provider_select"
+    )
+
+    # Model Selection
+    model_options = MODEL_OPTIONS[selected_provider]
+    selected_model_name = st.selectbox(
+        "Choose Model",
+        list(model_options.keys()),
+        key="model_select"
+    )
+    selected_model = model_options[selected_model_name]
+
+    # API Key Input
+    api_key = st.text_input(
+        f"{selected_provider} API Key",
+        type="password",
+        key="api_key_input",
+        help="Enter your API key. It will only be stored in session memory."
+    )
 
-        # SerpAPI Key
-        st.markdown("### SerpAPI (Optional)")
-        serp_api_key = st.text_input(
-            "SerpAPI Key",
-            type="password",
-            key="serp_key_input",
-            help="Optional: For fetching latest trends and info"
+    # LLM Parameters
+    with st.expander("Advanced Settings"):
+        temperature = st.slider(
+            "Temperature",
+            min_value=0.0,
+            max_value=1.0,
+            value=0.7,
+            step=0.1,
+            help="Higher values make output more creative"
         )
 
-        # Initialize button
-        if st.button("🚀 Initialize System", type="primary"):
-            if not api_key:
-                st.error("Please provide an API key")
-                return
+        max_tokens = st.number_input(
+            "Max Tokens",
+            min_value=500,
+            max_value=8000,
+            value=4000,
+            step=500
+        )
 
-            try:
-                with st.spinner("Initializing system..."):
-                    # Initialize LLM
-                    provider_map = {
-                        "OpenAI": "openai",
-                        "Google Gemini": "gemini",
-                        "Anthropic Claude": "claude",
-                        "xAI Grok": "grok"
-                    }
-
-                    st.session_state.llm = LLMFactory.create_from_params(
-                        provider=provider_map[selected_provider],
-                        api_key=api_key,
-                        model_name=selected_model,
-                        temperature=temperature,
-                        max_tokens=max_tokens
-                    )
+    # SerpAPI Key
+    st.markdown("### SerpAPI (Optional)")
+    serp_api_key = st.text_input(
+        "SerpAPI Key",
+        type="password",
+        key="serp_key_input",
+        help="Optional: For fetching latest trends and info"
+    )
 
-                    # Test LLM connection
-                    if st.session_state.llm.test_connection():
-                        st.success("✅ LLM initialized successfully!")
-                    else:
-                        st.error("❌ LLM connection failed. Please check your API key and try again.")
-                        # Reset LLM to None so user knows system isn't ready
-                        st.session_state.llm = None
-                        return
-
-                    # Initialize database
-                    try:
-                        db = DatabaseConnection()
-                        if db.test_connection():
-                            st.success("✅ Database connected!")
-                        else:
-                            st.error("❌ Database connection test failed")
-                            return
-                    except (ValueError, ConnectionError) as db_error:
-                        # Display detailed database connection error
-                        error_msg = str(db_error)
-                        st.error("❌ Database Connection Failed")
-                        with st.expander("🔍 Error Details & Solutions", expanded=True):
-                            st.markdown(f"**Error:** {error_msg}")
-                            st.markdown("---")
-                            st.markdown("### 📋 Setup Instructions")
-                            st.markdown("""
-                            1. **Create a `.env` file** in your project root with:
-                               ```env
-                               DB_HOST=your_database_host
-                               DB_PORT=5432
-                               DB_NAME=your_database_name
-                               DB_USER=your_username
-                               DB_PASSWORD=your_password
-                               ```
-                            
-                            2. **If using a local PostgreSQL server:**
-                               - Make sure PostgreSQL is running
-                               - Verify credentials in `.env`
-                            
-                            3. **If using a remote database (recommended for cloud deployments):**
-                               - Use your database provider's connection details
-                               - Ensure firewall rules allow connections from your IP
-                               - For Streamlit Cloud: Use environment variables in app settings
-                            """)
-                        logger.error(f"Database initialization error: {db_error}", exc_info=True)
-                        return
-                    except Exception as db_error:
-                        st.error(f"❌ Database initialization failed: {str(db_error)}")
-                        logger.error(f"Database initialization error: {db_error}", exc_info=True)
-                        return
-
-                    # Store database connection
-                    st.session_state.db = db
-
-                    # Load colleges list
-                    colleges_query = """
-                        SELECT college_id, name as college_name, city, state
-                        FROM mvx_college_data_flattened
-                        WHERE college_is_active = true
-                        ORDER BY name
-                        LIMIT 100;
-                    """
-                    st.session_state.colleges_list = db.execute_query(colleges_query)
-                    st.info(f"📚 Loaded {len(st.session_state.colleges_list)} colleges")
-
-                    # Initialize agents
-                    st.session_state.query_agent = SimpleQueryAgent(
-                        st.session_state.llm,
-                        db
-                    )
-                    st.session_state.topic_agent = TopicAgent(st.session_state.llm)
-                    st.session_state.template_agent = TemplateAgent(st.session_state.llm)
-                    st.session_state.content_agent = ContentAgent(st.session_state.llm)
-
-                    # Initialize SerpAPI if key provided
-                    if serp_api_key:
-                        st.session_state.serp_helper = SerpAPIHelper(serp_api_key)
-                        if st.session_state.serp_helper.test_connection():
-                            st.success("✅ SerpAPI initialized!")
-                        else:
-                            st.warning("⚠️ SerpAPI connection failed")
+    # Initialize button
+    if st.button("🚀 Initialize System", type="primary"):
+        was_initialized = st.session_state.llm is not None
+        if not api_key:
+            st.error("Please provide an API key")
+            return
+
+        try:
+            with st.spinner("Initializing system..."):
+                # Initialize LLM
+                provider_map = {
+                    "OpenAI": "openai",
+                    "Google Gemini": "gemini",
+                    "Anthropic Claude": "claude",
+                    "xAI Grok": "grok"
+                }
+
+                # Identical configurations reuse one cached client across sessions
+                api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+                llm_key = f"{provider_map[selected_provider]}:{selected_model}:{api_key_hash}:{temperature}:{max_tokens}"
+                st.session_state.llm = get_llm(
+                    provider_map[selected_provider],
+                    selected_model,
+                    api_key_hash,
+                    temperature,
+                    max_tokens,
+                    _api_key=api_key
+                )
+
+                # Initialize database
+                try:
+                    db = get_db()
+                except (ValueError, ConnectionError) as db_error:
+                    # Display detailed database connection error
+                    error_msg = str(db_error)
+                    st.error("❌ Database Connection Failed")
+                    with st.expander("🔍 Error Details & Solutions", expanded=True):
+                        st.markdown(f"**Error:** {error_msg}")
+                        st.markdown("---")
+                        st.markdown("### 📋 Setup Instructions")
+                        st.markdown("""
+                        1. **Create a `.env` file** in your project root with:
+                           ```env
+                           DB_HOST=your_database_host
+                           DB_PORT=5432
+                           DB_NAME=your_database_name
+                           DB_USER=your_username
+                           DB_PASSWORD=your_password
+                           ```
+                        
+                        2. **If using a local PostgreSQL server:**
+                           - Make sure PostgreSQL is running
+                           - Verify credentials in `.env`
+                        
+                        3. **If using a remote database (recommended for cloud deployments):**
+                           - Use your database provider's connection details
+                           - Ensure firewall rules allow connections from your IP
+                           - For Streamlit Cloud: Use environment variables in app settings
+                        """)
+                    logger.error(f"Database initialization error: {db_error}", exc_info=True)
+                    return
+                except Exception as db_error:
+                    st.error(f"❌ Database initialization failed: {str(db_error)}")
+                    logger.error(f"Database initialization error: {db_error}", exc_info=True)
+                    return
+
+                serp_helper = None
+                if serp_api_key:
+                    from utils.serpapi_helper import SerpAPIHelper
+                    serp_helper = SerpAPIHelper(serp_api_key)
+
+                # Probe the LLM, database and SerpAPI together rather than one after another
+                checks = {
+                    "LLM": st.session_state.llm.test_connection,
+                    "Database": db.test_connection,
+                }
+                if serp_helper:
+                    checks["SerpAPI"] = serp_helper.test_connection
+                connected = run_connection_tests(checks)
+
+                # Test LLM connection
+                if connected["LLM"]:
+                    st.success("✅ LLM initialized successfully!")
+                else:
+                    st.error("❌ LLM connection failed. Please check your API key and try again.")
+                    # Reset LLM to None so user knows system isn't ready
+                    st.session_state.llm = None
+                    return
+
+                # Test database connection
+                if connected["Database"]:
+                    st.success("✅ Database connected!")
+                else:
+                    st.error("❌ Database connection test failed")
+                    return
+
+                # Store database connection
+                st.session_state.db = db
+
+                # Drop searches cached against a previous configuration
+                count_matching_colleges.clear()
+                search_colleges.clear()
+
+                # The colleges list is loaded when "Select from List" is first shown
+                st.session_state.colleges_list = []
+
+                # Initialize agents
+                agents = get_agents(llm_key, st.session_state.llm, db)
+                st.session_state.query_agent = agents["query_agent"]
+                st.session_state.topic_agent = agents["topic_agent"]
+                st.session_state.template_agent = agents["template_agent"]
+                st.session_state.content_agent = agents["content_agent"]
+
+                # Initialize SerpAPI if key provided
+                if serp_helper:
+                    st.session_state.serp_helper = serp_helper
+                    if connected["SerpAPI"]:
+                        st.success("✅ SerpAPI initialized!")
                     else:
-                        st.session_state.serp_helper = None
-                        st.info("ℹ️ SerpAPI not configured")
+                        st.warning("⚠️ SerpAPI connection failed")
+                else:
+                    st.session_state.serp_helper = None
+                    st.info("ℹ️ SerpAPI not configured")
 
-                    st.success("🎉 System ready!")
+                st.success("🎉 System ready!")
 
-            except Exception as e:
-                st.error(f"Error initializing system: {str(e)}")
-                logger.error(f"Initialization error: {e}", exc_info=True)
+        except Exception as e:
+            st.error(f"Error initializing system: {str(e)}")
+            logger.error(f"Initialization error: {e}", exc_info=True)
+        else:
+            # The main interface only renders once an LLM is set, so the
+            # first initialization refreshes the whole page, not just this fragment
+            if not was_initialized:
+                st.rerun()
 
-        # System status
-        if st.session_state.llm:
-            st.markdown("---")
-            st.markdown("### ✅ System Status")
-            st.success("LLM: Ready")
-            st.success("Database: Connected")
-            if st.session_state.serp_helper:
-                st.success("SerpAPI: Active")
+    # System status
+    if st.session_state.llm:
+        st.markdown("---")
+        st.markdown("### ✅ System Status")
+        st.success("LLM: Ready")
+        st.success("Database: Connected")
+        if st.session_state.serp_helper:
+            st.success("SerpAPI: Active")
 
 
 def main_interface():
@@ -357,13 +725,10 @@ def main_interface():
     st.markdown('<div class="section-header">📝 Step 1: Select Content Type & College</div>', unsafe_allow_html=True)
 
     # Content Type Selection
-    content_type_options = get_content_type_options()
-    display_names = get_content_type_display_names()
-
     content_type = st.selectbox(
         "Content Type",
-        content_type_options,
-        format_func=lambda x: display_names.get(x, x),
+        CONTENT_TYPE_OPTIONS,
+        format_func=lambda x: CONTENT_TYPE_DISPLAY_NAMES.get(x, x),
         key="content_type"
     )
 
@@ -428,548 +793,79 @@ def main_interface():
     if is_comparison:
         st.info("💡 For comparison content, you can select 2-5 colleges to compare")
 
-    # Filter options container
-    if is_comparison:
-        filter_options = ["Multiple Colleges (Comparison)", "Search by Name/City", "Select from List"]
-    else:
-        filter_options = ["Search by Name/City", "Select from List"]
-
-    filter_option = st.radio(
-        "Filter colleges by:",
-        filter_options,
-        key="college_filter_option",
-        horizontal=False
-    )
-    
-    selected_college_id = None
+    college_selection(is_comparison)
 
-    # Handle different filter options
-    if filter_option == "Multiple Colleges (Comparison)":
-        if not st.session_state.db:
-            st.warning("⚠️ Please initialize the system first to enable college search")
-        else:
-            # Show current comparison list
-            if st.session_state.comparison_colleges_list:
-                st.markdown("**📋 Selected Colleges for Comparison:**")
-                for idx, college in enumerate(st.session_state.comparison_colleges_list):
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        st.write(f"{idx + 1}. {college['name']} - {college['city']}, {college['state']}")
-                    with col2:
-                        if st.button("🗑️ Remove", key=f"remove_comparison_{idx}"):
-                            st.session_state.comparison_colleges_list.pop(idx)
-                            st.rerun()
+    if st.button("🔍 Fetch College Data", type="primary"):
+        # Check if system is initialized
+        if not st.session_state.query_agent:
+            st.error("❌ System not initialized. Please initialize the system using the sidebar first.")
+            return
 
-                # Update selected_college_ids from comparison list
-                st.session_state.selected_college_ids = [c['id'] for c in st.session_state.comparison_colleges_list]
+        try:
+            with st.spinner("Fetching college data..."):
+                # Get selected college IDs (for comparison) or single ID
+                college_ids = st.session_state.selected_college_ids if st.session_state.selected_college_ids else None
+                college_id = st.session_state.selected_college if st.session_state.selected_college else None
 
-                if len(st.session_state.comparison_colleges_list) >= 2:
-                    st.success(f"✅ {len(st.session_state.comparison_colleges_list)} colleges selected (Ready to fetch data)")
+                # Generate a simple query based on selection
+                if college_ids and len(college_ids) > 0:
+                    auto_query = f"Fetch detailed information for {len(college_ids)} colleges for comparison"
+                elif college_id:
+                    auto_query = f"Fetch detailed information for college ID {college_id}"
                 else:
-                    st.warning(f"⚠️ Add at least {2 - len(st.session_state.comparison_colleges_list)} more college(s)")
+                    auto_query = f"Fetch information about colleges for {content_type} content"
 
-                st.markdown("---")
+                # Fetch data using simplified agent with field selection
+                result = st.session_state.query_agent.fetch_college_data(
+                    auto_query,
+                    content_type,
+                    selected_college_id=college_id,
+                    selected_college_ids=college_ids,
+                    selected_fields=st.session_state.selected_fields
+                )
 
-            # Search and add colleges
-            st.markdown("**🔍 Search and Add Colleges:**")
-            search_term = st.text_input(
-                "Search for colleges",
-                placeholder="Enter college name, city, or state (e.g., 'IIT Bombay', 'Delhi', 'Engineering')",
-                key="comparison_college_search",
-                help="Search to find colleges, then click 'Add' to include them in comparison"
-            )
+                st.session_state.fetched_data = result
+                st.session_state.data_fetched = True
 
-            if search_term:
-                with st.spinner("🔍 Searching colleges..."):
-                    # First, get total count
-                    count_query = f"""
-                        SELECT COUNT(*) as total
-                        FROM mvx_college_data_flattened
-                        WHERE college_is_active = true
-                            AND (
-                                LOWER(name) LIKE LOWER('%{search_term}%')
-                                OR LOWER(city) LIKE LOWER('%{search_term}%')
-                                OR LOWER(state) LIKE LOWER('%{search_term}%')
-                            );
-                    """
-                    count_result = st.session_state.db.execute_query(count_query)
-                    total_count = count_result[0]['total'] if count_result else 0
+                st.success(f"✅ Data fetched successfully! Found {result['row_count']} records")
 
-                    # Show result count
-                    if total_count > 0:
-                        st.info(f"📊 Found {total_count} matching college(s)")
+        except Exception as e:
+            st.error(f"Error fetching data: {str(e)}")
+            logger.error(f"Data fetch error: {e}", exc_info=True)
 
-                        # Add limit selector if there are many results
-                        result_limit = 20  # Default to 20 for comparison
-                        if total_count > 20:
-                            result_limit = st.select_slider(
-                                "Number of results to show",
-                                options=[20, 50, 100, 200],
-                                value=20,
-                                key="comparison_search_limit_slider"
-                            )
+    # Show data preview after fetching
+    if st.session_state.data_fetched and st.session_state.fetched_data:
+        st.markdown("---")
 
-                        limit_clause = f"LIMIT {result_limit}"
+        # Show data preview with enhanced UI
+        with st.expander("📊 View Data Preview", expanded=False):
+            st.markdown("**SQL Query Used:**")
+            st.code(st.session_state.fetched_data['sql_query'], language='sql')
 
-                        # Fetch colleges
-                        search_query = f"""
-                            SELECT college_id, name as college_name, city, state
-                            FROM mvx_college_data_flattened
-                            WHERE college_is_active = true
-                                AND (
-                                    LOWER(name) LIKE LOWER('%{search_term}%')
-                                    OR LOWER(city) LIKE LOWER('%{search_term}%')
-                                    OR LOWER(state) LIKE LOWER('%{search_term}%')
-                                )
-                            ORDER BY name
-                            {limit_clause};
-                        """
-                        search_results = st.session_state.db.execute_query(search_query)
-                    else:
-                        search_results = []
+            st.markdown("---")
 
-                    if search_results:
-                        st.markdown(f"**Search Results** (showing {len(search_results)} of {total_count}):")
+            if st.session_state.fetched_data['data']:
+                # Use the new visualization component (use_expander=False because we're already inside one)
+                display_college_data_preview(st.session_state.fetched_data['data'], max_display=3, use_expander=False)
+            else:
+                st.warning("⚠️ No data returned from the query")
 
-                        # Display results with Add buttons
-                        for college in search_results:
-                            col1, col2 = st.columns([4, 1])
-                            with col1:
-                                st.write(f"• {college['college_name']} - {college['city']}, {college['state']}")
-                            with col2:
-                                # Check if already added
-                                already_added = any(c['id'] == college['college_id'] for c in st.session_state.comparison_colleges_list)
-                                at_limit = len(st.session_state.comparison_colleges_list) >= 5
+    # Section 2: Topic Generation
+    if st.session_state.data_fetched:
+        topic_selection(content_type)
 
-                                if already_added:
-                                    st.button("✓ Added", key=f"added_{college['college_id']}", disabled=True)
-                                elif at_limit:
-                                    st.button("Limit (5)", key=f"limit_{college['college_id']}", disabled=True)
-                                else:
-                                    if st.button("➕ Add", key=f"add_comparison_{college['college_id']}"):
-                                        st.session_state.comparison_colleges_list.append({
-                                            'id': college['college_id'],
-                                            'name': college['college_name'],
-                                            'city': college['city'],
-                                            'state': college['state']
-                                        })
-                                        st.rerun()
-                    else:
-                        st.warning("⚠️ No colleges found matching your search")
-            else:
-                st.info("💡 Enter a search term to find colleges. You can search multiple times to add different colleges.")
-
-    elif filter_option == "Search by Name/City":
-        if not st.session_state.db:
-            st.warning("⚠️ Please initialize the system first to enable college search")
-        else:
-            search_term = st.text_input(
-                "Search colleges",
-                placeholder="Enter college name, city, or state",
-                key="college_search",
-                help="Search for colleges by name, city, or state"
-            )
-
-            if search_term:
-                with st.spinner("🔍 Searching colleges..."):
-                    # First, get total count
-                    count_query = f"""
-                        SELECT COUNT(*) as total
-                        FROM mvx_college_data_flattened
-                        WHERE college_is_active = true
-                            AND (
-                                LOWER(name) LIKE LOWER('%{search_term}%')
-                                OR LOWER(city) LIKE LOWER('%{search_term}%')
-                                OR LOWER(state) LIKE LOWER('%{search_term}%')
-                            );
-                    """
-                    count_result = st.session_state.db.execute_query(count_query)
-                    total_count = count_result[0]['total'] if count_result else 0
-
-                    # Show result count
-                    if total_count > 0:
-                        st.info(f"📊 Found {total_count} matching college(s)")
-
-                        # Add limit selector if there are many results
-                        if total_count > 100:
-                            result_limit = st.select_slider(
-                                "Number of results to show",
-                                options=[100, 200, 500, 1000, "All"],
-                                value=200,
-                                key="search_limit_slider"
-                            )
-                            limit_clause = f"LIMIT {result_limit}" if result_limit != "All" else ""
-                        else:
-                            limit_clause = ""
-
-                        # Fetch colleges
-                        search_query = f"""
-                            SELECT college_id, name as college_name, city, state
-                            FROM mvx_college_data_flattened
-                            WHERE college_is_active = true
-                                AND (
-                                    LOWER(name) LIKE LOWER('%{search_term}%')
-                                    OR LOWER(city) LIKE LOWER('%{search_term}%')
-                                    OR LOWER(state) LIKE LOWER('%{search_term}%')
-                                )
-                            ORDER BY name
-                            {limit_clause};
-                        """
-                        search_results = st.session_state.db.execute_query(search_query)
-                    else:
-                        search_results = []
-
-                    if search_results:
-                        college_options = {
-                            f"{c['college_name']} - {c['city']}, {c['state']}": c['college_id']
-                            for c in search_results
-                        }
-
-                        selected_college_name = st.selectbox(
-                            "Select college",
-                            list(college_options.keys()),
-                            key="searched_college_select",
-                            help=f"Showing {len(search_results)} of {total_count} matching college(s)"
-                        )
-                        
-                        if selected_college_name:
-                            selected_college_id = college_options[selected_college_name]
-                            st.session_state.selected_college = selected_college_id
-                            st.success(f"✅ Selected: {selected_college_name}")
-                    else:
-                        st.warning("⚠️ No colleges found matching your search")
-                        st.session_state.selected_college = None
-            else:
-                st.info("💡 Enter a search term to find colleges")
-                st.session_state.selected_college = None
-    
-    elif filter_option == "Select from List":
-        if not st.session_state.colleges_list:
-            st.warning("⚠️ Please initialize the system first to load college list")
-        else:
-            total_colleges = len(st.session_state.colleges_list)
-            st.info(f"📊 Total colleges available: {total_colleges}")
-
-            # Add limit selector if there are many colleges
-            if total_colleges > 100:
-                show_limit = st.select_slider(
-                    "Number of colleges to show in dropdown",
-                    options=[100, 200, 500, 1000, "All"],
-                    value=200,
-                    key="list_limit_slider"
-                )
-                limit = total_colleges if show_limit == "All" else show_limit
-            else:
-                limit = total_colleges
-
-            college_options = {
-                f"{c['college_name']} - {c['city']}, {c['state']}": c['college_id']
-                for c in st.session_state.colleges_list[:limit]
-            }
-
-            selected_college_name = st.selectbox(
-                "Select college",
-                ["None"] + list(college_options.keys()),
-                key="list_college_select",
-                help=f"Showing {len(college_options)} of {total_colleges} colleges"
-            )
-            
-            if selected_college_name != "None":
-                selected_college_id = college_options[selected_college_name]
-                st.session_state.selected_college = selected_college_id
-                st.success(f"✅ Selected: {selected_college_name}")
-            else:
-                st.session_state.selected_college = None
-
-    if st.button("🔍 Fetch College Data", type="primary"):
-        # Check if system is initialized
-        if not st.session_state.query_agent:
-            st.error("❌ System not initialized. Please initialize the system using the sidebar first.")
-            return
-
-        try:
-            with st.spinner("Fetching college data..."):
-                # Get selected college IDs (for comparison) or single ID
-                college_ids = st.session_state.selected_college_ids if st.session_state.selected_college_ids else None
-                college_id = st.session_state.selected_college if st.session_state.selected_college else None
-
-                # Generate a simple query based on selection
-                if college_ids and len(college_ids) > 0:
-                    auto_query = f"Fetch detailed information for {len(college_ids)} colleges for comparison"
-                elif college_id:
-                    auto_query = f"Fetch detailed information for college ID {college_id}"
-                else:
-                    auto_query = f"Fetch information about colleges for {content_type} content"
-
-                # Fetch data using simplified agent with field selection
-                result = st.session_state.query_agent.fetch_college_data(
-                    auto_query,
-                    content_type,
-                    selected_college_id=college_id,
-                    selected_college_ids=college_ids,
-                    selected_fields=st.session_state.selected_fields
-                )
-
-                st.session_state.fetched_data = result
-                st.session_state.data_fetched = True
-
-                st.success(f"✅ Data fetched successfully! Found {result['row_count']} records")
-
-        except Exception as e:
-            st.error(f"Error fetching data: {str(e)}")
-            logger.error(f"Data fetch error: {e}", exc_info=True)
-
-    # Show data preview after fetching
-    if st.session_state.data_fetched and st.session_state.fetched_data:
-        st.markdown("---")
-
-        # Show data preview with enhanced UI
-        with st.expander("📊 View Data Preview", expanded=False):
-            st.markdown("**SQL Query Used:**")
-            st.code(st.session_state.fetched_data['sql_query'], language='sql')
-
-            st.markdown("---")
-
-            if st.session_state.fetched_data['data']:
-                # Use the new visualization component (use_expander=False because we're already inside one)
-                display_college_data_preview(st.session_state.fetched_data['data'], max_display=3, use_expander=False)
-            else:
-                st.warning("⚠️ No data returned from the query")
-
-    # Section 2: Topic Generation
-    if st.session_state.data_fetched:
-        st.markdown("---")
-        st.markdown('<div class="section-header">💡 Step 2: Select Content Topic</div>', unsafe_allow_html=True)
-
-        # Generate topics button
-        if st.button("✨ Generate Topic Suggestions", key="generate_topics_btn"):
-            try:
-                with st.spinner("Generating topic ideas based on college data..."):
-                    # Prepare detailed data summary with rankings, fees, programs
-                    row_count = st.session_state.fetched_data['row_count']
-                    data_summary = f"Found {row_count} college(s)\n\n"
-
-                    if st.session_state.fetched_data['data']:
-                        # Create detailed summary for first 3 colleges
-                        colleges = st.session_state.fetched_data['data'][:3]
-                        for college in colleges:
-                            name = college.get('name', 'N/A')
-                            city = college.get('city', 'N/A')
-                            state = college.get('state', 'N/A')
-                            data_summary += f"\n### {name} ({city}, {state})\n"
-
-                            # Year established
-                            year = college.get('year_of_established')
-                            if year:
-                                data_summary += f"- Established: {year}\n"
-
-                            # Rankings
-                            rankings = college.get('rankings', {})
-                            if rankings and isinstance(rankings, dict):
-                                if 'nirf_rank' in rankings:
-                                    data_summary += f"- NIRF Rank: {rankings['nirf_rank']}\n"
-                                if 'naac_grade' in rankings:
-                                    data_summary += f"- NAAC Grade: {rankings['naac_grade']}\n"
-
-                            # Top programs/degrees
-                            degrees = college.get('degrees', [])
-                            if degrees and isinstance(degrees, list) and len(degrees) > 0:
-                                programs = []
-                                for deg in degrees[:3]:  # First 3 programs
-                                    if isinstance(deg, dict) and 'program_name' in deg:
-                                        programs.append(deg['program_name'])
-                                if programs:
-                                    data_summary += f"- Programs: {', '.join(programs)}\n"
-
-                            # Fees (if available)
-                            if 'fees' in college and college['fees']:
-                                data_summary += f"- Fees: {college['fees']}\n"
-
-                            # Accreditations count
-                            accreds = college.get('accreditations', [])
-                            if accreds and isinstance(accreds, list):
-                                data_summary += f"- Accreditations: {len(accreds)}\n"
-
-                            # Infrastructure count
-                            infra = college.get('infrastructure', [])
-                            if infra and isinstance(infra, list):
-                                data_summary += f"- Facilities: {len(infra)}\n"
-
-                            data_summary += "\n"
-
-                    # Generate topics
-                    topics = st.session_state.topic_agent.generate_topics(
-                        data_summary,
-                        content_type,
-                        num_topics=8
-                    )
-
-                    st.session_state.generated_topics = topics
-                    st.session_state.topics_generated = True
-
-                    if topics and len(topics) > 0:
-                        st.success(f"✅ Generated {len(topics)} topic ideas!")
-                    else:
-                        st.warning("⚠️ Using default topic suggestions (custom generation unavailable)")
-
-            except Exception as e:
-                st.error(f"Error generating topics: {str(e)}")
-                logger.error(f"Topic generation error: {e}", exc_info=True)
-
-        # Display generated topics
-        if st.session_state.topics_generated and st.session_state.generated_topics:
-            st.markdown("### 📌 Select a Topic")
-            st.info("💡 Choose a topic from the suggestions below, or add your own custom topic")
-
-            # Display topics as a clean vertical list
-            for i, topic in enumerate(st.session_state.generated_topics):
-                with st.container():
-                    col1, col2 = st.columns([4, 1])
-
-                    with col1:
-                        st.markdown(f"**{i+1}. {topic['topic']}**")
-                        st.caption(topic['focus'])
-
-                    with col2:
-                        if st.button("Select", key=f"select_topic_{i}", width='stretch'):
-                            st.session_state.selected_topic = topic.copy()
-                            st.success(f"✅ Selected: {topic['topic']}")
-                            st.rerun()
-
-                    st.markdown("---")
-
-        # Custom topic input
-        st.markdown("### ✏️ Or Enter Custom Topic")
-        custom_topic = st.text_input(
-            "Enter your own topic",
-            placeholder="Example: Complete guide to MBA admissions and placements",
-            key="custom_topic_input"
-        )
-
-        if custom_topic and st.button("Use Custom Topic"):
-            st.session_state.selected_topic = {
-                "topic": custom_topic,
-                "focus": "Custom user-defined topic"
-            }
-            st.success(f"✅ Using custom topic: {custom_topic}")
-            st.rerun()
-
-    # Display selected topic
-    if st.session_state.selected_topic:
-        st.markdown("---")
-        st.markdown('<div class="selected-prompt-box">', unsafe_allow_html=True)
-        st.markdown("### 🎯 Selected Topic")
-        st.markdown(f"**{st.session_state.selected_topic['topic']}**")
-        st.caption(f"Focus: {st.session_state.selected_topic['focus']}")
-        st.markdown('</div>', unsafe_allow_html=True)
+    # Display selected topic
+    if st.session_state.selected_topic:
+        st.markdown("---")
+        st.markdown('<div class="selected-prompt-box">', unsafe_allow_html=True)
+        st.markdown("### 🎯 Selected Topic")
+        st.markdown(f"**{st.session_state.selected_topic['topic']}**")
+        st.caption(f"Focus: {st.session_state.selected_topic['focus']}")
+        st.markdown('</div>', unsafe_allow_html=True)
 
     # Section 3: Enter Custom Prompt
     if st.session_state.selected_topic:
-        st.markdown("---")
-        st.markdown('<div class="section-header">📝 Step 3: Define Your Content Prompt</div>', unsafe_allow_html=True)
-
-        # Predefined prompt templates
-        prompt_templates = {
-            "Custom (Write your own)": "",
-            "Comprehensive College Guide": """Write a comprehensive guide about the college(s) in the dataset. The content should include:
-
-1. Overview and Introduction: Brief history, establishment year, location highlights
-2. Academic Excellence: Top programs, accreditations, rankings (NIRF, NAAC)
-3. Admission Process: Eligibility criteria, entrance exams, application procedures, important dates
-4. Fees Structure: Detailed breakdown by program, scholarship opportunities
-5. Infrastructure & Facilities: Campus amenities, library, labs, hostels, sports facilities
-6. Placements & Career: Average packages, top recruiters, placement statistics
-7. Student Life: Clubs, events, cultural activities
-8. Contact Information: Address, phone, email, website
-
-Target audience: Students and parents making informed decisions about higher education.
-Tone: Professional yet approachable, factual with engaging narrative.""",
-
-            "Comparison & Rankings Focus": """Create a detailed comparison and ranking analysis of the college(s):
-
-1. Rankings Analysis: Break down NIRF rankings, NAAC grades, and other accreditations
-2. Program Comparisons: Compare similar programs across metrics (fees, duration, seats)
-3. Competitive Analysis: Position relative to other colleges in the region
-4. Strengths & Weaknesses: Honest assessment of what makes these colleges stand out
-5. Best For: Recommendations for different student profiles
-6. Value Proposition: ROI analysis considering fees vs. placement outcomes
-
-Include data-driven insights, statistics, and comparative tables where relevant.
-Tone: Analytical, objective, data-focused.""",
-
-            "Admission & Career Guide": """Develop a practical guide focused on admissions and career outcomes:
-
-1. Admission Strategy: Step-by-step application guide, important deadlines
-2. Entrance Exam Preparation: Required exams, cutoffs, preparation tips
-3. Eligibility Requirements: Academic qualifications, age limits, reservation criteria
-4. Career Opportunities: Industry connections, internship programs
-5. Placement Track Record: Year-wise placement data, sector-wise distribution
-6. Alumni Network: Notable alumni, career trajectories
-7. Industry Partnerships: Corporate tie-ups, training programs
-
-Target audience: Aspiring students preparing for admissions.
-Tone: Action-oriented, motivational, practical.""",
-
-            "Structured Query Expansion": """Analyze the college(s) data and expand the content across multiple dimensions:
-
-CONTENT DIMENSIONS:
-1. Factual Information: Establish year, location, governance type, affiliations
-2. Academic Portfolio: Programs offered, specializations, unique courses
-3. Infrastructure Deep-dive: Physical facilities, digital infrastructure, accessibility
-4. Financial Aspects: Fees structure, payment plans, scholarships, financial aid
-5. Quality Metrics: Accreditations, certifications, compliance standards
-6. Student Experience: Campus life, diversity, support services
-7. Career Pathways: Placement cell, industry connections, entrepreneurship support
-
-TRANSFORMATION TYPES:
-- Core Facts: Direct information from database
-- Comparative Insights: How it compares with peer institutions
-- Implicit Details: What prospective students typically want to know
-- Entity Expansions: Detailed breakdowns of programs, facilities, etc.
-- User Intent Matching: Address common questions and concerns
-
-Provide comprehensive coverage with proper structure, headings, and data-backed claims.
-Tone: Systematic, thorough, information-rich."""
-        }
-
-        # Dropdown to select template
-        selected_template = st.selectbox(
-            "Choose a prompt template or write custom",
-            list(prompt_templates.keys()),
-            key="prompt_template_select"
-        )
-
-        # Get the template text
-        template_text = prompt_templates[selected_template]
-
-        # Button to load selected template
-        if selected_template != "Custom (Write your own)":
-            if st.button("📋 Load Template"):
-                # Use the text area's widget key directly
-                st.session_state.custom_prompt_input = template_text
-                st.rerun()
-
-        # Initialize the text area widget state if needed
-        if 'custom_prompt_input' not in st.session_state:
-            st.session_state.custom_prompt_input = ""
-
-        # Text area - uses its own key in session state
-        custom_prompt = st.text_area(
-            "Content prompt/instructions",
-            placeholder="Example: Write a comprehensive guide covering admission process, fees structure, top courses, and placement statistics.",
-            height=250,
-            key="custom_prompt_input",
-            help="Describe what you want in the content - the angle, tone, key points to cover, etc."
-        )
-
-        # Keep user_prompt in sync for other parts of the app
-        st.session_state.user_prompt = custom_prompt
-
-        # Show styled box if prompt is entered
-        if st.session_state.user_prompt:
-            st.markdown("### 📝 Your Prompt")
-            st.markdown(st.session_state.user_prompt)
-            st.markdown('</div>', unsafe_allow_html=True)
+        prompt_editor()
 
     # Section 3.5: Keyword Upload (Optional)
     if st.session_state.user_prompt:
@@ -1043,55 +939,7 @@ Tone: Systematic, thorough, information-rich."""
 
     # Section 4: Template Generation
     if st.session_state.user_prompt:
-        st.markdown("---")
-        st.markdown('<div class="section-header">📋 Step 4: Review Content Structure</div>', unsafe_allow_html=True)
-
-        if st.button("🏗️ Generate Content Template", disabled=not st.session_state.user_prompt):
-            try:
-                with st.spinner("Creating content structure..."):
-                    # Prepare data summary
-                    data_summary = f"Records: {st.session_state.fetched_data['row_count']}\n"
-                    if st.session_state.fetched_data['data']:
-                        import json
-                        data_summary += json.dumps(st.session_state.fetched_data['data'][:5], indent=2, default=str)
-
-                    # Get SerpAPI context
-                    serp_context = ""
-                    if st.session_state.serp_helper:
-                        serp_context = st.session_state.serp_helper.get_context_for_llm(st.session_state.user_prompt)
-
-                    # Create a prompt dict combining topic and user's custom prompt
-                    topic_text = st.session_state.selected_topic['topic'] if st.session_state.selected_topic else ""
-                    combined_prompt = f"Topic: {topic_text}\n\n{st.session_state.user_prompt}"
-
-                    user_prompt_dict = {
-                        'title': topic_text if topic_text else 'Custom Content',
-                        'angle': st.session_state.user_prompt,
-                        'description': combined_prompt
-                    }
-
-                    # Generate template
-                    template = st.session_state.template_agent.generate_template(
-                        user_prompt_dict,
-                        content_type,
-                        data_summary,
-                        serp_context
-                    )
-
-                    st.session_state.template = template
-                    st.session_state.template_generated = True
-
-                    st.success("✅ Content structure created!")
-
-            except Exception as e:
-                st.error(f"Error generating template: {str(e)}")
-                logger.error(f"Template generation error: {e}", exc_info=True)
-
-        # Display template
-        if st.session_state.template_generated and st.session_state.template:
-            with st.expander("📄 View Content Structure", expanded=True):
-                summary = st.session_state.template_agent.get_template_summary(st.session_state.template)
-                st.markdown(summary)
+        template_review(content_type)
 
     # Section 5: Content Generation
     if st.session_state.template_generated:
@@ -1104,17 +952,21 @@ Tone: Systematic, thorough, information-rich."""
             height=80
         )
 
+        generate_by_sections = st.checkbox(
+            "⚡ Generate sections in parallel",
+            value=False,
+            help="Write each outline section with its own LLM call, all at once. "
+                 "Faster for long outlines; sections are written independently."
+        )
+
         if st.button("🎨 Generate Content", type="primary"):
             try:
-                with st.spinner("Generating your content... This may take a moment..."):
+                with st.spinner("Preparing your content request..."):
                     # Prepare data
-                    import json
-                    data_str = json.dumps(st.session_state.fetched_data['data'], indent=2, default=str)
+                    data_str = serialize_fetched_data()
 
                     # Get SerpAPI context
-                    serp_context = ""
-                    if st.session_state.serp_helper:
-                        serp_context = st.session_state.serp_helper.get_context_for_llm(st.session_state.user_prompt)
+                    serp_context = get_serp_context()
 
                     # Add keywords to additional instructions if available
                     final_instructions = additional_instructions
@@ -1128,18 +980,35 @@ Tone: Systematic, thorough, information-rich."""
                         else:
                             final_instructions = keyword_str
 
-                    # Generate content
-                    content = st.session_state.content_agent.generate_content(
-                        st.session_state.template,
-                        data_str,
-                        serp_context,
-                        final_instructions
+                # After "Regenerate" the cached response is skipped; clear the
+                # flag on both paths so it cannot leak into a later run
+                bust_cache = st.session_state.pop('_regenerate_content', False)
+
+                if generate_by_sections:
+                    with st.spinner("Generating sections in parallel..."):
+                        content = st.session_state.content_agent.generate_content_by_sections(
+                            st.session_state.template,
+                            data_str,
+                            serp_context,
+                            final_instructions,
+                            bust_cache=bust_cache
+                        )
+                else:
+                    # Generate content, rendering it as the LLM produces it
+                    content = st.write_stream(
+                        st.session_state.content_agent.generate_content_stream(
+                            st.session_state.template,
+                            data_str,
+                            serp_context,
+                            final_instructions,
+                            bust_cache=bust_cache
+                        )
                     )
 
-                    st.session_state.final_content = content
-                    st.session_state.content_generated = True
+                st.session_state.final_content = content.strip()
+                st.session_state.content_generated = True
 
-                    st.success("✅ Content generated successfully!")
+                st.success("✅ Content generated successfully!")
 
             except Exception as e:
                 st.error(f"Error generating content: {str(e)}")
@@ -1178,6 +1047,7 @@ Tone: Systematic, thorough, information-rich."""
             with col3:
                 if st.button("🔄 Regenerate"):
                     st.session_state.content_generated = False
+                    st.session_state._regenerate_content = True
                     st.rerun()
 
             # Preview
@@ -1185,6 +1055,476 @@ Tone: Systematic, thorough, information-rich."""
                 st.markdown(edited_content)
 
 
+@st.fragment
+def college_selection(is_comparison: bool):
+    """
+    Render the college selection controls; searching, adding and removing
+    colleges rerun only this fragment.
+
+    Args:
+        is_comparison: Whether the selected content type is a comparison
+    """
+    # Filter options container
+    if is_comparison:
+        filter_options = ["Multiple Colleges (Comparison)", "Search by Name/City", "Select from List"]
+    else:
+        filter_options = ["Search by Name/City", "Select from List"]
+
+    filter_option = st.radio(
+        "Filter colleges by:",
+        filter_options,
+        key="college_filter_option",
+        horizontal=False
+    )
+    
+    selected_college_id = None
+
+    # Handle different filter options
+    if filter_option == "Multiple Colleges (Comparison)":
+        if not st.session_state.db:
+            st.warning("⚠️ Please initialize the system first to enable college search")
+        else:
+            # Show current comparison list
+            if st.session_state.comparison_colleges_list:
+                st.markdown("**📋 Selected Colleges for Comparison:**")
+                for idx, college in enumerate(st.session_state.comparison_colleges_list):
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        st.write(f"{idx + 1}. {college['name']} - {college['city']}, {college['state']}")
+                    with col2:
+                        if st.button("🗑️ Remove", key=f"remove_comparison_{idx}"):
+                            st.session_state.comparison_colleges_list.pop(idx)
+                            st.rerun(scope="fragment")
+
+                # Update selected_college_ids from comparison list
+                st.session_state.selected_college_ids = [c['id'] for c in st.session_state.comparison_colleges_list]
+
+                if len(st.session_state.comparison_colleges_list) >= 2:
+                    st.success(f"✅ {len(st.session_state.comparison_colleges_list)} colleges selected (Ready to fetch data)")
+                else:
+                    st.warning(f"⚠️ Add at least {2 - len(st.session_state.comparison_colleges_list)} more college(s)")
+
+                st.markdown("---")
+
+            # Search and add colleges
+            st.markdown("**🔍 Search and Add Colleges:**")
+            search_term = st.text_input(
+                "Search for colleges",
+                placeholder="Enter college name, city, or state (e.g., 'IIT Bombay', 'Delhi', 'Engineering')",
+                key="comparison_college_search",
+                help="Search to find colleges, then click 'Add' to include them in comparison"
+            )
+
+            if search_term:
+                with st.spinner("🔍 Searching colleges..."):
+                    # First, get total count
+                    search_term = search_term.lower()
+                    total_count = count_matching_colleges(st.session_state.db, search_term)
+
+                    # Show result count
+                    if total_count > 0:
+                        st.info(f"📊 Found {total_count} matching college(s)")
+
+                        # Add limit selector if there are many results
+                        result_limit = 20  # Default to 20 for comparison
+                        if total_count > 20:
+                            result_limit = st.select_slider(
+                                "Number of results to show",
+                                options=[20, 50, 100, 200],
+                                value=20,
+                                key="comparison_search_limit_slider"
+                            )
+
+                        # Fetch colleges
+                        search_results = search_colleges(st.session_state.db, search_term, result_limit)
+                    else:
+                        search_results = []
+
+                    if search_results:
+                        st.markdown(f"**Search Results** (showing {len(search_results)} of {total_count}):")
+
+                        # Display results with Add buttons
+                        for college in search_results:
+                            col1, col2 = st.columns([4, 1])
+                            with col1:
+                                st.write(f"• {college['college_name']} - {college['city']}, {college['state']}")
+                            with col2:
+                                # Check if already added
+                                already_added = any(c['id'] == college['college_id'] for c in st.session_state.comparison_colleges_list)
+                                at_limit = len(st.session_state.comparison_colleges_list) >= 5
+
+                                if already_added:
+                                    st.button("✓ Added", key=f"added_{college['college_id']}", disabled=True)
+                                elif at_limit:
+                                    st.button("Limit (5)", key=f"limit_{college['college_id']}", disabled=True)
+                                else:
+                                    if st.button("➕ Add", key=f"add_comparison_{college['college_id']}"):
+                                        st.session_state.comparison_colleges_list.append({
+                                            'id': college['college_id'],
+                                            'name': college['college_name'],
+                                            'city': college['city'],
+                                            'state': college['state']
+                                        })
+                                        st.rerun(scope="fragment")
+                    else:
+                        st.warning("⚠️ No colleges found matching your search")
+            else:
+                st.info("💡 Enter a search term to find colleges. You can search multiple times to add different colleges.")
+
+    elif filter_option == "Search by Name/City":
+        if not st.session_state.db:
+            st.warning("⚠️ Please initialize the system first to enable college search")
+        else:
+            search_term = st.text_input(
+                "Search colleges",
+                placeholder="Enter college name, city, or state",
+                key="college_search",
+                help="Search for colleges by name, city, or state"
+            )
+
+            if search_term:
+                with st.spinner("🔍 Searching colleges..."):
+                    # First, get total count
+                    search_term = search_term.lower()
+                    total_count = count_matching_colleges(st.session_state.db, search_term)
+
+                    # Show result count
+                    if total_count > 0:
+                        st.info(f"📊 Found {total_count} matching college(s)")
+
+                        # Add limit selector if there are many results
+                        if total_count > 100:
+                            result_limit = st.select_slider(
+                                "Number of results to show",
+                                options=[100, 200, 500, 1000, "All"],
+                                value=200,
+                                key="search_limit_slider"
+                            )
+                            if result_limit == "All":
+                                result_limit = None
+                        else:
+                            result_limit = None
+
+                        # Fetch colleges
+                        search_results = search_colleges(st.session_state.db, search_term, result_limit)
+                    else:
+                        search_results = []
+
+                    if search_results:
+                        college_labels, college_ids = college_choices(
+                            "_search_choices", (search_term, result_limit), search_results
+                        )
+
+                        selected_index = st.selectbox(
+                            "Select college",
+                            range(len(college_labels)),
+                            format_func=college_labels.__getitem__,
+                            key="searched_college_select",
+                            help=f"Showing {len(search_results)} of {total_count} matching college(s)"
+                        )
+                        
+                        if selected_index is not None:
+                            selected_college_id = college_ids[selected_index]
+                            st.session_state.selected_college = selected_college_id
+                            st.success(f"✅ Selected: {college_labels[selected_index]}")
+                    else:
+                        st.warning("⚠️ No colleges found matching your search")
+                        st.session_state.selected_college = None
+            else:
+                st.info("💡 Enter a search term to find colleges")
+                st.session_state.selected_college = None
+    
+    elif filter_option == "Select from List":
+        # Loaded on first use rather than during initialization, so users who
+        # search never wait for it; load_colleges caches it across sessions
+        if st.session_state.db and not st.session_state.colleges_list:
+            with st.spinner("📚 Loading colleges..."):
+                try:
+                    st.session_state.colleges_list = load_colleges(st.session_state.db)
+                except Exception as e:
+                    st.error(f"Error loading colleges: {str(e)}")
+                    logger.error(f"College list load error: {e}", exc_info=True)
+
+        if not st.session_state.colleges_list:
+            st.warning("⚠️ Please initialize the system first to load college list")
+        else:
+            total_colleges = len(st.session_state.colleges_list)
+            st.info(f"📊 Total colleges available: {total_colleges}")
+
+            # Add limit selector if there are many colleges
+            if total_colleges > 100:
+                show_limit = st.select_slider(
+                    "Number of colleges to show in dropdown",
+                    options=[100, 200, 500, 1000, "All"],
+                    value=200,
+                    key="list_limit_slider"
+                )
+                limit = total_colleges if show_limit == "All" else show_limit
+            else:
+                limit = total_colleges
+
+            college_options = {
+                f"{c['college_name']} - {c['city']}, {c['state']}": c['college_id']
+                for c in st.session_state.colleges_list[:limit]
+            }
+
+            selected_college_name = st.selectbox(
+                "Select college",
+                ["None"] + list(college_options.keys()),
+                key="list_college_select",
+                help=f"Showing {len(college_options)} of {total_colleges} colleges"
+            )
+            
+            if selected_college_name != "None":
+                selected_college_id = college_options[selected_college_name]
+                st.session_state.selected_college = selected_college_id
+                st.success(f"✅ Selected: {selected_college_name}")
+            else:
+                st.session_state.selected_college = None
+
+
+@st.fragment
+def topic_selection(content_type: str):
+    """
+    Render Step 2 (topic generation and selection) as a fragment.
+
+    Args:
+        content_type: Selected content type
+    """
+    st.markdown("---")
+    st.markdown('<div class="section-header">💡 Step 2: Select Content Topic</div>', unsafe_allow_html=True)
+
+    # Generate topics button
+    if st.button("✨ Generate Topic Suggestions", key="generate_topics_btn"):
+        try:
+            with st.spinner("Generating topic ideas based on college data..."):
+                # Prepare detailed data summary with rankings, fees, programs
+                row_count = st.session_state.fetched_data['row_count']
+                data_summary = f"Found {row_count} college(s)\n\n"
+
+                if st.session_state.fetched_data['data']:
+                    # Create detailed summary for first 3 colleges
+                    colleges = st.session_state.fetched_data['data'][:3]
+                    for college in colleges:
+                        name = college.get('name', 'N/A')
+                        city = college.get('city', 'N/A')
+                        state = college.get('state', 'N/A')
+                        data_summary += f"\n### {name} ({city}, {state})\n"
+
+                        # Year established
+                        year = college.get('year_of_established')
+                        if year:
+                            data_summary += f"- Established: {year}\n"
+
+                        # Rankings
+                        rankings = college.get('rankings', {})
+                        if rankings and isinstance(rankings, dict):
+                            if 'nirf_rank' in rankings:
+                                data_summary += f"- NIRF Rank: {rankings['nirf_rank']}\n"
+                            if 'naac_grade' in rankings:
+                                data_summary += f"- NAAC Grade: {rankings['naac_grade']}\n"
+
+                        # Top programs/degrees
+                        degrees = college.get('degrees', [])
+                        if degrees and isinstance(degrees, list) and len(degrees) > 0:
+                            programs = []
+                            for deg in degrees[:3]:  # First 3 programs
+                                if isinstance(deg, dict) and 'program_name' in deg:
+                                    programs.append(deg['program_name'])
+                            if programs:
+                                data_summary += f"- Programs: {', '.join(programs)}\n"
+
+                        # Fees (if available)
+                        if 'fees' in college and college['fees']:
+                            data_summary += f"- Fees: {college['fees']}\n"
+
+                        # Accreditations count
+                        accreds = college.get('accreditations', [])
+                        if accreds and isinstance(accreds, list):
+                            data_summary += f"- Accreditations: {len(accreds)}\n"
+
+                        # Infrastructure count
+                        infra = college.get('infrastructure', [])
+                        if infra and isinstance(infra, list):
+                            data_summary += f"- Facilities: {len(infra)}\n"
+
+                        data_summary += "\n"
+
+                # Generate topics
+                # Clicking again for the same data asks for fresh ideas
+                topics = st.session_state.topic_agent.generate_topics(
+                    data_summary,
+                    content_type,
+                    num_topics=8,
+                    bust_cache=st.session_state.topics_generated
+                )
+
+                st.session_state.generated_topics = topics
+                st.session_state.topics_generated = True
+
+                if topics and len(topics) > 0:
+                    st.success(f"✅ Generated {len(topics)} topic ideas!")
+                else:
+                    st.warning("⚠️ Using default topic suggestions (custom generation unavailable)")
+
+        except Exception as e:
+            st.error(f"Error generating topics: {str(e)}")
+            logger.error(f"Topic generation error: {e}", exc_info=True)
+
+    # Display generated topics
+    if st.session_state.topics_generated and st.session_state.generated_topics:
+        st.markdown("### 📌 Select a Topic")
+        st.info("💡 Choose a topic from the suggestions below, or add your own custom topic")
+
+        # One radio and one button, however many topics were generated
+        topics = st.session_state.generated_topics
+        topic_index = st.radio(
+            "Suggested topics",
+            range(len(topics)),
+            format_func=lambda i: f"**{i + 1}. {topics[i]['topic']}**",
+            captions=[topic['focus'] for topic in topics],
+            key="topic_choice",
+            label_visibility="collapsed"
+        )
+
+        if st.button("✅ Use Selected Topic", key="select_topic_btn", width='stretch'):
+            st.session_state.selected_topic = topics[topic_index].copy()
+            st.rerun()
+
+        st.markdown("---")
+
+    # Custom topic input
+    st.markdown("### ✏️ Or Enter Custom Topic")
+    custom_topic = st.text_input(
+        "Enter your own topic",
+        placeholder="Example: Complete guide to MBA admissions and placements",
+        key="custom_topic_input"
+    )
+
+    if custom_topic and st.button("Use Custom Topic"):
+        st.session_state.selected_topic = {
+            "topic": custom_topic,
+            "focus": "Custom user-defined topic"
+        }
+        st.success(f"✅ Using custom topic: {custom_topic}")
+        st.rerun()
+
+
+@st.fragment
+def prompt_editor():
+    """Render Step 3 (prompt template and editor); typing reruns only this fragment."""
+    st.markdown("---")
+    st.markdown('<div class="section-header">📝 Step 3: Define Your Content Prompt</div>', unsafe_allow_html=True)
+
+    # Dropdown to select template
+    selected_template = st.selectbox(
+        "Choose a prompt template or write custom",
+        tuple(PROMPT_TEMPLATES),
+        key="prompt_template_select"
+    )
+
+    # Get the template text
+    template_text = PROMPT_TEMPLATES[selected_template]
+
+    # Button to load selected template
+    if selected_template != "Custom (Write your own)":
+        if st.button("📋 Load Template"):
+            # Use the text area's widget key directly
+            st.session_state.custom_prompt_input = template_text
+            st.rerun()
+
+    # Initialize the text area widget state if needed
+    if 'custom_prompt_input' not in st.session_state:
+        st.session_state.custom_prompt_input = ""
+
+    # Text area - uses its own key in session state
+    custom_prompt = st.text_area(
+        "Content prompt/instructions",
+        placeholder="Example: Write a comprehensive guide covering admission process, fees structure, top courses, and placement statistics.",
+        height=250,
+        key="custom_prompt_input",
+        help="Describe what you want in the content - the angle, tone, key points to cover, etc."
+    )
+
+    # Keep user_prompt in sync for other parts of the app
+    had_prompt = bool(st.session_state.user_prompt)
+    st.session_state.user_prompt = custom_prompt
+
+    # The keyword and template steps only render once a prompt exists, so
+    # refresh the whole page when the prompt is first entered or cleared
+    if bool(custom_prompt) != had_prompt:
+        st.rerun()
+
+    # Show styled box if prompt is entered
+    if st.session_state.user_prompt:
+        st.markdown("### 📝 Your Prompt")
+        st.markdown(st.session_state.user_prompt)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def template_review(content_type: str):
+    """
+    Render Step 4 (content structure generation and review) as a fragment.
+
+    Args:
+        content_type: Selected content type
+    """
+    st.markdown("---")
+    st.markdown('<div class="section-header">📋 Step 4: Review Content Structure</div>', unsafe_allow_html=True)
+
+    if st.button("🏗️ Generate Content Template", disabled=not st.session_state.user_prompt):
+        try:
+            with st.spinner("Creating content structure..."):
+                # Prepare data summary
+                data_summary = f"Records: {st.session_state.fetched_data['row_count']}\n"
+                if st.session_state.fetched_data['data']:
+                    data_summary += serialize_fetched_data(limit=5)
+
+                # Get SerpAPI context
+                serp_context = get_serp_context()
+
+                # Create a prompt dict combining topic and user's custom prompt
+                topic_text = st.session_state.selected_topic['topic'] if st.session_state.selected_topic else ""
+                combined_prompt = f"Topic: {topic_text}\n\n{st.session_state.user_prompt}"
+
+                user_prompt_dict = {
+                    'title': topic_text if topic_text else 'Custom Content',
+                    'angle': st.session_state.user_prompt,
+                    'description': combined_prompt
+                }
+
+                # Generate template; clicking again for the same inputs asks for a fresh outline
+                template = st.session_state.template_agent.generate_template(
+                    user_prompt_dict,
+                    content_type,
+                    data_summary,
+                    serp_context,
+                    bust_cache=st.session_state.template_generated
+                )
+
+                st.session_state.template = template
+                was_generated = st.session_state.template_generated
+                st.session_state.template_generated = True
+
+                st.success("✅ Content structure created!")
+
+        except Exception as e:
+            st.error(f"Error generating template: {str(e)}")
+            logger.error(f"Template generation error: {e}", exc_info=True)
+        else:
+            # Step 5 only renders once a template exists, so the first
+            # template refreshes the whole page, not just this fragment
+            if not was_generated:
+                st.rerun()
+
+    # Display template
+    if st.session_state.template_generated and st.session_state.template:
+        with st.expander("📄 View Content Structure", expanded=True):
+            summary = st.session_state.template_agent.get_template_summary(st.session_state.template)
+            st.markdown(summary)
+
+
 def main():
     """Main application entry point."""
     initialize_session_state()
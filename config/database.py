@@ -7,6 +7,16 @@ from typing import Optional
 
 load_dotenv()
 
+# Relation the agents read college rows from. Point this at a live view that
+# merges the materialized view with an incremental delta table to avoid
+# waiting on full REFRESH MATERIALIZED VIEW runs.
+COLLEGE_DATA_VIEW = os.getenv("COLLEGE_DATA_VIEW", "mvx_college_data_flattened")
+
+# Prepare parameterized queries server-side once per connection. Leave off
+# behind transaction-mode poolers (PgBouncer, Supabase pooler), where a
+# named statement may not exist on the backend that runs EXECUTE.
+DB_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "false").lower() in ("1", "true", "yes")
+
 
 @dataclass
 class DatabaseConfig:
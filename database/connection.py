@@ -1,19 +1,60 @@
 """Database connection manager for PostgreSQL."""
 
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import errors, extensions, pool
+from collections import OrderedDict
 from typing import Optional, Any, List, Dict
+import hashlib
 import logging
-from config.database import DatabaseConfig
+import re
+from config.database import DatabaseConfig, DB_PREPARED_STATEMENTS
 
 logger = logging.getLogger(__name__)
 
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 16
+# Server-side prepared statements kept per connection (least recently used are deallocated)
+PREPARED_STATEMENT_CACHE_SIZE = 64
+
+_PLACEHOLDER_RE = re.compile(r'%[s%]')
+# SELECT * plans are tied to the relation's current columns, so they are never prepared
+_SELECT_STAR_RE = re.compile(r'\bSELECT\s+(?:DISTINCT\s+)?\*', re.IGNORECASE)
+# Raised when a prepared statement no longer matches the relation it reads
+# (cached plan must not change result type) or is missing on the backend
+_STALE_STATEMENT_ERRORS = (
+    errors.FeatureNotSupported,
+    errors.InvalidSqlStatementName,
+    errors.DuplicatePreparedStatement
+)
+
+
+def _to_server_placeholders(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as $1, $2, ... for PREPARE."""
+    position = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal position
+        if match.group() == '%%':
+            return '%'
+        position += 1
+        return f"${position}"
+
+    return _PLACEHOLDER_RE.sub(replace, query)
+
+
+class _PooledConnection(extensions.connection):
+    """psycopg2 connection that remembers the statements prepared on its session."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: "OrderedDict[str, None]" = OrderedDict()
+
 
 class DatabaseConnection:
     """Singleton database connection manager."""
 
     _instance: Optional['DatabaseConnection'] = None
-    _connection_pool: Optional[pool.SimpleConnectionPool] = None
+    _connection_pool: Optional[pool.ThreadedConnectionPool] = None
 
     def __new__(cls):
         """Ensure singleton pattern."""
@@ -32,9 +73,11 @@ class DatabaseConnection:
             config = DatabaseConfig()
             params = config.get_psycopg2_params()
 
-            self._connection_pool = pool.SimpleConnectionPool(
-                minconn=1,
-                maxconn=10,
+            # Streamlit serves sessions from several threads, so the pool must be thread-safe
+            self._connection_pool = pool.ThreadedConnectionPool(
+                minconn=POOL_MIN_CONNECTIONS,
+                maxconn=POOL_MAX_CONNECTIONS,
+                connection_factory=_PooledConnection,
                 **params
             )
             logger.info("Database connection pool initialized successfully")
@@ -121,6 +164,11 @@ class DatabaseConnection:
         """
         Execute a SELECT query and return results as a list of dictionaries.
 
+        With DB_PREPARED_STATEMENTS enabled, parameterized explicit-column
+        queries are prepared server-side once per connection and then run with
+        EXECUTE, so repeated query shapes skip parsing and planning. A statement
+        that is stale or missing is dropped and the query retried unprepared.
+
         Args:
             query: SQL query string
             params: Query parameters (optional)
@@ -133,7 +181,22 @@ class DatabaseConnection:
             conn = self.get_connection()
             cursor = conn.cursor()
 
-            if params:
+            statement = None
+            if params and isinstance(params, (tuple, list)):
+                statement = self._statement_name(conn, query)
+
+            if statement:
+                try:
+                    self._prepare(conn, cursor, statement, query)
+                    cursor.execute(f"EXECUTE {statement} ({', '.join(['%s'] * len(params))})", params)
+                except _STALE_STATEMENT_ERRORS as e:
+                    # The relation behind the cached plan changed, or a pooler
+                    # routed us to another backend: drop the statements and retry once
+                    logger.warning("Prepared statement %s unusable, retrying unprepared: %s", statement, e)
+                    conn.rollback()
+                    self._reset_prepared(conn, cursor)
+                    cursor.execute(query, params)
+            elif params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
@@ -156,8 +219,60 @@ class DatabaseConnection:
             raise
         finally:
             if conn:
+                # End the read transaction so the pooled connection is clean (and
+                # not left aborted after an error) for the next caller
+                if not conn.closed:
+                    conn.rollback()
                 self.return_connection(conn)
 
+    def _statement_name(self, conn, query: str) -> Optional[str]:
+        """
+        Get the server-side prepared statement name for a query, if it is prepared.
+
+        Args:
+            conn: Connection the statement would exist on
+            query: SQL query string with %s placeholders
+
+        Returns:
+            Statement name, or None if prepared statements are disabled, the
+            connection does not track them or the query selects *
+        """
+        if (
+            not DB_PREPARED_STATEMENTS
+            or getattr(conn, 'prepared_statements', None) is None
+            or _SELECT_STAR_RE.search(query)
+        ):
+            return None
+        return f"stmt_{hashlib.sha1(query.encode()).hexdigest()[:16]}"
+
+    def _prepare(self, conn, cursor, statement: str, query: str) -> None:
+        """
+        Prepare a statement on a connection unless it already is.
+
+        Args:
+            conn: Connection the statement must exist on
+            cursor: Cursor on that connection
+            statement: Statement name from _statement_name
+            query: SQL query string with %s placeholders
+        """
+        prepared = conn.prepared_statements
+        if statement in prepared:
+            prepared.move_to_end(statement)
+            return
+
+        cursor.execute(f"PREPARE {statement} AS {_to_server_placeholders(query)}")
+        prepared[statement] = None
+
+        if len(prepared) > PREPARED_STATEMENT_CACHE_SIZE:
+            evicted, _ = prepared.popitem(last=False)
+            cursor.execute(f"DEALLOCATE {evicted}")
+
+    def _reset_prepared(self, conn, cursor) -> None:
+        """Deallocate every prepared statement on a connection and forget them."""
+        cursor.execute("DEALLOCATE ALL")
+        conn.commit()
+        conn.prepared_statements.clear()
+
     def execute_update(self, query: str, params: Optional[tuple] = None) -> int:
         """
         Execute an INSERT, UPDATE, or DELETE query.
@@ -1,7 +1,7 @@
 """MCP client for PostgreSQL database introspection and operations."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet
 from database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,8 @@ class PostgresMCPClient:
             db_connection: Database connection instance
         """
         self.db = db_connection
+        # Rendered schema context per table set; introspection results rarely change
+        self._schema_context_cache: Dict[Optional[FrozenSet[str]], str] = {}
 
     def get_schema_info(self, table_names: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -281,6 +283,11 @@ class PostgresMCPClient:
         Returns:
             Formatted schema description
         """
+        cache_key = frozenset(table_names) if table_names else None
+        cached = self._schema_context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         schema_info = self.get_schema_info(table_names)
 
         if not schema_info:
@@ -307,4 +314,5 @@ class PostgresMCPClient:
 
             context += "\n"
 
+        self._schema_context_cache[cache_key] = context
         return context
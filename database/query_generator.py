@@ -1,6 +1,7 @@
 """SQL query generator for content generation."""
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple
 from database.connection import DatabaseConnection
 from database.schema_parser import DBMLParser
 import logging
@@ -20,6 +21,9 @@ class QueryGenerator:
         """
         self.db = DatabaseConnection()
         self.schema_parser = DBMLParser(dbml_path)
+        # The parsed schema never changes, so lookups are memoized per instance
+        self._relevant_tables_for = lru_cache(maxsize=256)(self._find_relevant_tables)
+        self._schema_context_for = lru_cache(maxsize=256)(self.schema_parser.get_table_info_for_llm)
 
     def get_relevant_tables(self, keywords: List[str]) -> List[str]:
         """
@@ -31,6 +35,18 @@ class QueryGenerator:
         Returns:
             List of relevant table names
         """
+        return list(self._relevant_tables_for(frozenset(keywords)))
+
+    def _find_relevant_tables(self, keywords: FrozenSet[str]) -> Tuple[str, ...]:
+        """
+        Scan the schema for tables matching any keyword.
+
+        Args:
+            keywords: Keywords to search for
+
+        Returns:
+            Tuple of relevant table names
+        """
         relevant_tables = set()
 
         for table_name in self.schema_parser.get_all_table_names():
@@ -57,7 +73,7 @@ class QueryGenerator:
                         relevant_tables.add(table_name)
                         break
 
-        return list(relevant_tables)
+        return tuple(relevant_tables)
 
     def get_schema_context(self, table_names: Optional[List[str]] = None) -> str:
         """
@@ -69,7 +85,7 @@ class QueryGenerator:
         Returns:
             Schema information formatted for LLM
         """
-        return self.schema_parser.get_table_info_for_llm(table_names)
+        return self._schema_context_for(tuple(table_names) if table_names is not None else None)
 
     def execute_query(self, sql: str) -> List[Dict[str, Any]]:
         """
@@ -98,13 +114,47 @@ class QueryGenerator:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return self.validate_queries([sql])[0]
+
+    def validate_queries(self, sqls: List[str]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate several SQL queries over one connection without executing them.
+
+        Each query is EXPLAINed inside its own savepoint, so a failing query
+        does not abort the checks that follow it.
+
+        Args:
+            sqls: SQL queries to validate
+
+        Returns:
+            List of (is_valid, error_message) tuples, one per query
+        """
+        results: List[Tuple[bool, Optional[str]]] = []
+        conn = None
         try:
-            # Use EXPLAIN to validate without executing
-            explain_sql = f"EXPLAIN {sql}"
-            self.db.execute_query(explain_sql)
-            return True, None
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+
+            for sql in sqls:
+                cursor.execute("SAVEPOINT validate_query")
+                try:
+                    # Use EXPLAIN to validate without executing
+                    cursor.execute(f"EXPLAIN {sql}")
+                    results.append((True, None))
+                except Exception as e:
+                    results.append((False, str(e)))
+                cursor.execute("ROLLBACK TO SAVEPOINT validate_query")
+
+            cursor.close()
         except Exception as e:
-            return False, str(e)
+            # Connection-level failure: report it for every query not yet checked
+            results.extend((False, str(e)) for _ in sqls[len(results):])
+        finally:
+            if conn:
+                conn.rollback()
+                self.db.return_connection(conn)
+
+        return results
 
     def get_college_basic_info(self, college_id: Optional[int] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -199,19 +249,19 @@ class QueryGenerator:
         Returns:
             Matching colleges
         """
-        query = f"""
+        query = """
             SELECT *
             FROM college_basic
             WHERE (
-                LOWER(name) LIKE %s
-                OR LOWER(city) LIKE %s
-                OR LOWER(state) LIKE %s
+                name ILIKE %s
+                OR city ILIKE %s
+                OR state ILIKE %s
             )
             AND is_active = true
-            LIMIT {limit}
+            LIMIT %s
         """
-        search_pattern = f"%{search_term.lower()}%"
-        return self.db.execute_query(query, (search_pattern, search_pattern, search_pattern))
+        search_pattern = f"%{search_term}%"
+        return self.db.execute_query(query, (search_pattern, search_pattern, search_pattern, limit))
 
     def get_college_complete_data(self, college_id: int) -> Dict[str, Any]:
         """
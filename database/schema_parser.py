@@ -4,6 +4,14 @@ import re
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 
+# DBML patterns, compiled once at import
+_TABLE_RE = re.compile(r'Table\s+(\w+)\s*\{([^}]+)\}', re.MULTILINE | re.DOTALL)
+_DATA_TYPE_RE = re.compile(r'(\w+(?:\(\d+\))?)')
+_ATTRS_RE = re.compile(r'\[([^\]]+)\]')
+_REF_RE = re.compile(r'ref:\s*[>-]+\s*([\w.]+)')
+_DEFAULT_RE = re.compile(r'default:\s*(.+)')
+_NOTE_RE = re.compile(r"note:\s*['\"](.+)['\"]")
+
 
 @dataclass
 class TableColumn:
@@ -40,6 +48,8 @@ class DBMLParser:
         """
         self.dbml_file_path = dbml_file_path
         self.tables: Dict[str, Table] = {}
+        # Rendered LLM schema block per table, reused across requests
+        self._table_info_chunks: Dict[str, str] = {}
         self._parse()
 
     def _parse(self):
@@ -48,10 +58,7 @@ class DBMLParser:
             content = f.read()
 
         # Extract all table definitions
-        table_pattern = r'Table\s+(\w+)\s*\{([^}]+)\}'
-        matches = re.finditer(table_pattern, content, re.MULTILINE | re.DOTALL)
-
-        for match in matches:
+        for match in _TABLE_RE.finditer(content):
             table_name = match.group(1)
             table_body = match.group(2)
             self._parse_table(table_name, table_body)
@@ -106,7 +113,7 @@ class DBMLParser:
         remainder = parts[1]
 
         # Extract data type
-        data_type_match = re.match(r'(\w+(?:\(\d+\))?)', remainder)
+        data_type_match = _DATA_TYPE_RE.match(remainder)
         if not data_type_match:
             return None
 
@@ -117,7 +124,7 @@ class DBMLParser:
 
         # Check for attributes
         if '[' in remainder:
-            attrs_match = re.search(r'\[([^\]]+)\]', remainder)
+            attrs_match = _ATTRS_RE.search(remainder)
             if attrs_match:
                 attrs = attrs_match.group(1)
                 self._parse_column_attributes(column, attrs)
@@ -152,19 +159,19 @@ class DBMLParser:
             elif attr.startswith('ref:'):
                 column.is_foreign_key = True
                 # Extract reference (e.g., "ref: > table.column")
-                ref_match = re.search(r'ref:\s*[>-]+\s*([\w.]+)', attr)
+                ref_match = _REF_RE.search(attr)
                 if ref_match:
                     column.references = ref_match.group(1)
 
             # Default value
             elif attr.startswith('default:'):
-                default_match = re.search(r'default:\s*(.+)', attr)
+                default_match = _DEFAULT_RE.search(attr)
                 if default_match:
                     column.default_value = default_match.group(1).strip()
 
             # Note
             elif attr.startswith('note:'):
-                note_match = re.search(r"note:\s*['\"](.+)['\"]", attr)
+                note_match = _NOTE_RE.search(attr)
                 if note_match:
                     column.note = note_match.group(1)
 
@@ -263,31 +270,50 @@ class DBMLParser:
         if table_names is None:
             table_names = self.get_all_table_names()
 
-        info = "Database Schema Information:\n\n"
-
+        chunks = ["Database Schema Information:\n\n"]
         for table_name in table_names:
-            table = self.get_table(table_name)
-            if not table:
-                continue
+            chunk = self._get_table_info_chunk(table_name)
+            if chunk:
+                chunks.append(chunk)
 
-            info += f"Table: {table_name}\n"
-            if table.note:
-                info += f"Description: {table.note}\n"
+        return "".join(chunks)
 
-            info += "Columns:\n"
-            for col in table.columns:
-                info += f"  - {col.name} ({col.data_type})"
-                if col.note:
-                    info += f" - {col.note}"
-                if col.is_foreign_key and col.references:
-                    info += f" -> References {col.references}"
-                info += "\n"
+    def _get_table_info_chunk(self, table_name: str) -> Optional[str]:
+        """
+        Get the LLM schema block for one table, rendering it on first use.
 
-            # Add related tables
-            related = self.get_related_tables(table_name)
-            if related:
-                info += f"Related Tables: {', '.join(sorted(related))}\n"
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Formatted table block or None if the table is unknown
+        """
+        chunk = self._table_info_chunks.get(table_name)
+        if chunk is not None:
+            return chunk
 
-            info += "\n"
+        table = self.get_table(table_name)
+        if not table:
+            return None
 
-        return info
+        lines = [f"Table: {table_name}"]
+        if table.note:
+            lines.append(f"Description: {table.note}")
+
+        lines.append("Columns:")
+        for col in table.columns:
+            line = f"  - {col.name} ({col.data_type})"
+            if col.note:
+                line += f" - {col.note}"
+            if col.is_foreign_key and col.references:
+                line += f" -> References {col.references}"
+            lines.append(line)
+
+        # Add related tables
+        related = self.get_related_tables(table_name)
+        if related:
+            lines.append(f"Related Tables: {', '.join(sorted(related))}")
+
+        chunk = "\n".join(lines) + "\n\n"
+        self._table_info_chunks[table_name] = chunk
+        return chunk
@@ -1,9 +1,10 @@
 """Anthropic Claude LLM implementation."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Iterator
 import logging
+import time
 from anthropic import Anthropic
-from models.llm_interface import BaseLLM
+from models.llm_interface import BaseLLM, BATCH_TIMEOUT
 from config.llm_config import LLMConfig
 
 logger = logging.getLogger(__name__)
@@ -38,9 +39,10 @@ class ClaudeModel(BaseLLM):
             }
 
             if system_prompt:
-                kwargs["system"] = system_prompt
+                kwargs["system"] = self._cacheable_system(system_prompt)
 
             response = self.client.messages.create(**kwargs)
+            self._log_cache_usage(response)
 
             return response.content[0].text
 
@@ -48,6 +50,34 @@ class ClaudeModel(BaseLLM):
             logger.error(f"Error generating with Claude: {e}")
             raise
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text chunks for a prompt."""
+        try:
+            kwargs = {
+                "model": self.config.get_default_model(),
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": self._get_temperature(temperature),
+                "max_tokens": self._get_max_tokens(max_tokens)
+            }
+
+            if system_prompt:
+                kwargs["system"] = self._cacheable_system(system_prompt)
+
+            with self.client.messages.stream(**kwargs) as stream:
+                for text in stream.text_stream:
+                    yield text
+                self._log_cache_usage(stream.get_final_message())
+
+        except Exception as e:
+            logger.error(f"Error streaming with Claude: {e}")
+            raise
+
     def generate_with_history(
         self,
         messages: List[Dict[str, str]],
@@ -76,9 +106,10 @@ class ClaudeModel(BaseLLM):
             }
 
             if system_prompt:
-                kwargs["system"] = system_prompt
+                kwargs["system"] = self._cacheable_system(system_prompt)
 
             response = self.client.messages.create(**kwargs)
+            self._log_cache_usage(response)
 
             return response.content[0].text
 
@@ -86,6 +117,83 @@ class ClaudeModel(BaseLLM):
             logger.error(f"Error generating with Claude: {e}")
             raise
 
+    def generate_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+        timeout: float = BATCH_TIMEOUT
+    ) -> List[str]:
+        """Generate text for several prompts through the Message Batches API."""
+        try:
+            batch_requests = []
+            for i, request in enumerate(requests):
+                params = {
+                    "model": self.config.get_default_model(),
+                    "messages": [{"role": "user", "content": request["prompt"]}],
+                    "temperature": self._get_temperature(request.get("temperature")),
+                    "max_tokens": self._get_max_tokens(request.get("max_tokens"))
+                }
+                if request.get("system_prompt"):
+                    params["system"] = self._cacheable_system(request["system_prompt"])
+                batch_requests.append({"custom_id": f"request-{i}", "params": params})
+
+            batch = self.client.messages.batches.create(requests=batch_requests)
+            logger.info(f"Submitted Claude batch {batch.id} with {len(batch_requests)} requests")
+
+            deadline = time.monotonic() + timeout
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    self.client.messages.batches.cancel(batch.id)
+                    raise TimeoutError(f"Claude batch {batch.id} did not end within {timeout:.0f}s")
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            texts = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    texts[entry.custom_id] = entry.result.message.content[0].text
+                else:
+                    logger.error(f"Claude batch request {entry.custom_id} {entry.result.type}")
+
+            missing = [f"request-{i}" for i in range(len(requests)) if f"request-{i}" not in texts]
+            if missing:
+                raise RuntimeError(f"Claude batch {batch.id} requests failed: {', '.join(missing)}")
+
+            return [texts[f"request-{i}"] for i in range(len(requests))]
+
+        except Exception as e:
+            logger.error(f"Error generating batch with Claude: {e}")
+            raise
+
+    def _cacheable_system(self, system_prompt: str) -> List[Dict[str, Any]]:
+        """
+        Wrap a system prompt in a text block marked for prompt caching.
+
+        System prompts are static per content type, so marking them as an
+        ephemeral cache breakpoint lets repeat calls read the prefix from cache.
+
+        Args:
+            system_prompt: System prompt text
+
+        Returns:
+            System content blocks for the Messages API
+        """
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    def _log_cache_usage(self, response) -> None:
+        """Log prompt cache reads/writes reported by the API."""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        logger.debug(
+            f"Claude prompt cache: read={getattr(usage, 'cache_read_input_tokens', 0)}, "
+            f"created={getattr(usage, 'cache_creation_input_tokens', 0)}"
+        )
+
     def test_connection(self) -> bool:
         """Test Claude connection."""
         try:
@@ -1,6 +1,6 @@
 """Google Gemini LLM implementation."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 import logging
 import google.generativeai as genai
 from models.llm_interface import BaseLLM
@@ -53,6 +53,44 @@ class GeminiModel(BaseLLM):
             logger.error(f"Error generating with Gemini: {e}")
             raise
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text chunks for a prompt."""
+        try:
+            # Combine system prompt with user prompt
+            full_prompt = prompt
+            if system_prompt:
+                full_prompt = f"{system_prompt}\n\n{prompt}"
+
+            generation_config = {
+                "temperature": self._get_temperature(temperature),
+                "max_output_tokens": self._get_max_tokens(max_tokens),
+            }
+
+            response = self.client.generate_content(
+                full_prompt,
+                generation_config=generation_config,
+                stream=True
+            )
+
+            for chunk in response:
+                try:
+                    text = chunk.text
+                except (ValueError, AttributeError):
+                    # Chunks without text parts (e.g., safety or finish metadata)
+                    continue
+                if text:
+                    yield text
+
+        except Exception as e:
+            logger.error(f"Error streaming with Gemini: {e}")
+            raise
+
     def generate_with_history(
         self,
         messages: List[Dict[str, str]],
@@ -1,6 +1,6 @@
 """xAI Grok LLM implementation."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 import logging
 from openai import OpenAI
 from models.llm_interface import BaseLLM
@@ -54,6 +54,38 @@ class GrokModel(BaseLLM):
             logger.error(f"Error generating with Grok: {e}")
             raise
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text chunks for a prompt."""
+        try:
+            messages = []
+
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+
+            messages.append({"role": "user", "content": prompt})
+
+            stream = self.client.chat.completions.create(
+                model=self.config.get_default_model(),
+                messages=messages,
+                temperature=self._get_temperature(temperature),
+                max_tokens=self._get_max_tokens(max_tokens),
+                stream=True
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"Error streaming with Grok: {e}")
+            raise
+
     def generate_with_history(
         self,
         messages: List[Dict[str, str]],
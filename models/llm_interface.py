@@ -1,9 +1,12 @@
 """Abstract LLM interface for multi-model support."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from config.llm_config import LLMConfig
 
+# Seconds generate_batch waits for a provider batch; most batches end well within an hour
+BATCH_TIMEOUT = 60 * 60
+
 
 class BaseLLM(ABC):
     """Abstract base class for LLM implementations."""
@@ -46,6 +49,71 @@ class BaseLLM(ABC):
         """
         pass
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream generated text chunks for a prompt.
+
+        Providers with a streaming API override this; the default yields the
+        full response as a single chunk.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Temperature override (optional)
+            max_tokens: Max tokens override (optional)
+
+        Yields:
+            Generated text chunks
+        """
+        yield self.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    def generate_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+        timeout: float = BATCH_TIMEOUT
+    ) -> List[str]:
+        """
+        Generate text for several independent prompts.
+
+        Providers with a Batch API override this to submit all requests as one
+        discounted asynchronous job; the default issues them one by one.
+
+        Args:
+            requests: List of dicts with 'prompt' and optional 'system_prompt',
+                'temperature' and 'max_tokens'
+            poll_interval: Seconds between batch status checks (batch providers only)
+            timeout: Seconds to wait for the batch to end before cancelling it
+                (batch providers only)
+
+        Returns:
+            Generated texts in request order
+
+        Raises:
+            TimeoutError: If the batch has not ended within timeout
+            RuntimeError: If the batch or any request in it failed
+        """
+        return [
+            self.generate(
+                request["prompt"],
+                system_prompt=request.get("system_prompt"),
+                temperature=request.get("temperature"),
+                max_tokens=request.get("max_tokens")
+            )
+            for request in requests
+        ]
+
     @abstractmethod
     def generate_with_history(
         self,
@@ -66,13 +134,21 @@ class BaseLLM(ABC):
         """
         pass
 
+    def resolve_temperature(self, override: Optional[float] = None) -> float:
+        """Get the temperature a request will use, falling back to the configured value."""
+        return override if override is not None else self.config.temperature
+
+    def resolve_max_tokens(self, override: Optional[int] = None) -> int:
+        """Get the max tokens a request will use, falling back to the configured value."""
+        return override if override is not None else self.config.max_tokens
+
     def _get_temperature(self, override: Optional[float] = None) -> float:
         """Get temperature value."""
-        return override if override is not None else self.config.temperature
+        return self.resolve_temperature(override)
 
     def _get_max_tokens(self, override: Optional[int] = None) -> int:
         """Get max tokens value."""
-        return override if override is not None else self.config.max_tokens
+        return self.resolve_max_tokens(override)
 
     @abstractmethod
     def test_connection(self) -> bool:
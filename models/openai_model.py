@@ -1,9 +1,11 @@
 """OpenAI LLM implementation."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Any
+import json
 import logging
+import time
 from openai import OpenAI
-from models.llm_interface import BaseLLM
+from models.llm_interface import BaseLLM, BATCH_TIMEOUT
 from config.llm_config import LLMConfig
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,38 @@ class OpenAIModel(BaseLLM):
             logger.error(f"Error generating with OpenAI: {e}")
             raise
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text chunks for a prompt."""
+        try:
+            messages = []
+
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+
+            messages.append({"role": "user", "content": prompt})
+
+            stream = self.client.chat.completions.create(
+                model=self.config.get_default_model(),
+                messages=messages,
+                temperature=self._get_temperature(temperature),
+                max_tokens=self._get_max_tokens(max_tokens),
+                stream=True
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"Error streaming with OpenAI: {e}")
+            raise
+
     def generate_with_history(
         self,
         messages: List[Dict[str, str]],
@@ -71,6 +105,77 @@ class OpenAIModel(BaseLLM):
             logger.error(f"Error generating with OpenAI: {e}")
             raise
 
+    def generate_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+        timeout: float = BATCH_TIMEOUT
+    ) -> List[str]:
+        """Generate text for several prompts through the Batch API."""
+        try:
+            lines = []
+            for i, request in enumerate(requests):
+                messages = []
+                if request.get("system_prompt"):
+                    messages.append({"role": "system", "content": request["system_prompt"]})
+                messages.append({"role": "user", "content": request["prompt"]})
+
+                lines.append(json.dumps({
+                    "custom_id": f"request-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.config.get_default_model(),
+                        "messages": messages,
+                        "temperature": self._get_temperature(request.get("temperature")),
+                        "max_tokens": self._get_max_tokens(request.get("max_tokens"))
+                    }
+                }))
+
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    self.client.batches.cancel(batch.id)
+                    raise TimeoutError(f"OpenAI batch {batch.id} did not end within {timeout:.0f}s")
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+            texts = {}
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    texts[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+                else:
+                    logger.error(f"OpenAI batch request {entry.get('custom_id')} failed: {entry.get('error')}")
+
+            missing = [f"request-{i}" for i in range(len(requests)) if f"request-{i}" not in texts]
+            if missing:
+                raise RuntimeError(f"OpenAI batch {batch.id} requests failed: {', '.join(missing)}")
+
+            return [texts[f"request-{i}"] for i in range(len(requests))]
+
+        except Exception as e:
+            logger.error(f"Error generating batch with OpenAI: {e}")
+            raise
+
     def test_connection(self) -> bool:
         """Test OpenAI connection."""
         try:
@@ -1,8 +1,22 @@
 """Content type definitions and metadata."""
 
+import re
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+# Approximate output tokens per word of markdown (headings, bullets, tables)
+TOKENS_PER_WORD = 1.4
+# Extra output tokens reserved per non-empty outline line
+TOKENS_PER_OUTLINE_LINE = 20
+# Section budget: fixed allowance plus output per outline point
+SECTION_BASE_TOKENS = 300
+TOKENS_PER_SECTION_POINT = 150
+# Floor for any completion budget so short outlines still get a full answer
+MIN_MAX_TOKENS = 512
+# Word counts inside ideal_length strings such as "1000-2000 words"
+_WORD_COUNT_RE = re.compile(r'\d+')
 
 
 class ContentType(Enum):
@@ -13,12 +27,12 @@ class ContentType(Enum):
     COMPARISON = "comparison"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ContentTypeMetadata:
-    """Metadata for content types."""
+    """Metadata for content types (immutable so lookups can be cached)."""
     name: str
     description: str
-    typical_sections: List[str]
+    typical_sections: Tuple[str, ...]
     ideal_length: str
     tone: str
 
@@ -28,28 +42,28 @@ CONTENT_TYPE_METADATA: Dict[ContentType, ContentTypeMetadata] = {
     ContentType.WEB_ARTICLE: ContentTypeMetadata(
         name="Web Article",
         description="General informational article about a topic",
-        typical_sections=["Introduction", "Main Content", "Key Takeaways", "Conclusion"],
+        typical_sections=("Introduction", "Main Content", "Key Takeaways", "Conclusion"),
         ideal_length="1000-2000 words",
         tone="Informative, engaging"
     ),
     ContentType.FAQ_PAGE: ContentTypeMetadata(
         name="FAQ Page",
         description="Frequently Asked Questions with answers",
-        typical_sections=["Question & Answer pairs", "Categories"],
+        typical_sections=("Question & Answer pairs", "Categories"),
         ideal_length="800-1500 words",
         tone="Clear, concise, helpful"
     ),
     ContentType.BLOG_POST: ContentTypeMetadata(
         name="Blog Post",
         description="Blog post about a topic",
-        typical_sections=["Introduction", "Main Content", "Conclusion"],
+        typical_sections=("Introduction", "Main Content", "Conclusion"),
         ideal_length="1000-2000 words",
         tone="Informative, engaging"
     ),
     ContentType.COMPARISON: ContentTypeMetadata(
         name="Comparison",
         description="Side-by-side comparison of multiple colleges",
-        typical_sections=[
+        typical_sections=(
             "Overview",
             "Rankings Comparison",
             "Fees & Scholarships Comparison",
@@ -57,32 +71,33 @@ CONTENT_TYPE_METADATA: Dict[ContentType, ContentTypeMetadata] = {
             "Infrastructure & Facilities Comparison",
             "Admission Process Comparison",
             "Verdict & Recommendations"
-        ],
+        ),
         ideal_length="1500-2500 words",
         tone="Analytical, objective, data-driven"
     ),
 }
 
 
+# UI lists derived once from the static definitions above
+_CONTENT_TYPE_OPTIONS: Tuple[str, ...] = tuple(ct.value for ct in ContentType)
+_CONTENT_TYPE_DISPLAY_NAMES: Dict[str, str] = {
+    ct.value: CONTENT_TYPE_METADATA[ct].name if ct in CONTENT_TYPE_METADATA
+    else ct.value.replace('_', ' ').title()
+    for ct in ContentType
+}
+
+
 def get_content_type_options() -> List[str]:
     """Get list of content type names for UI selection."""
-    return [ct.value for ct in ContentType]
+    return list(_CONTENT_TYPE_OPTIONS)
 
 
 def get_content_type_display_names() -> Dict[str, str]:
     """Get mapping of content type values to display names."""
-    return {
-        ct.value: CONTENT_TYPE_METADATA.get(ct, ContentTypeMetadata(
-            name=ct.value.replace('_', ' ').title(),
-            description="",
-            typical_sections=[],
-            ideal_length="",
-            tone=""
-        )).name
-        for ct in ContentType
-    }
+    return dict(_CONTENT_TYPE_DISPLAY_NAMES)
 
 
+@lru_cache(maxsize=64)
 def get_content_type_metadata(content_type: str) -> ContentTypeMetadata:
     """
     Get metadata for a content type.
@@ -98,7 +113,7 @@ def get_content_type_metadata(content_type: str) -> ContentTypeMetadata:
         return CONTENT_TYPE_METADATA.get(ct, ContentTypeMetadata(
             name=content_type.replace('_', ' ').title(),
             description="Custom content type",
-            typical_sections=["Introduction", "Main Content", "Conclusion"],
+            typical_sections=("Introduction", "Main Content", "Conclusion"),
             ideal_length="1000-1500 words",
             tone="Informative"
         ))
@@ -106,7 +121,49 @@ def get_content_type_metadata(content_type: str) -> ContentTypeMetadata:
         return ContentTypeMetadata(
             name=content_type,
             description="Custom content type",
-            typical_sections=["Introduction", "Main Content", "Conclusion"],
+            typical_sections=("Introduction", "Main Content", "Conclusion"),
             ideal_length="1000-1500 words",
             tone="Informative"
         )
+
+
+def estimate_max_tokens(
+    metadata: ContentTypeMetadata,
+    outline_text: str = "",
+    cap: int = 4000
+) -> int:
+    """
+    Estimate a completion token budget for full content generation.
+
+    Args:
+        metadata: Content type metadata (its ideal_length drives the budget)
+        outline_text: Rendered outline the content must follow
+        cap: Upper bound for the budget
+
+    Returns:
+        max_tokens value to request
+    """
+    word_counts = [int(n) for n in _WORD_COUNT_RE.findall(metadata.ideal_length.replace(',', ''))]
+    max_words = max(word_counts) if word_counts else 1500
+
+    outline_lines = sum(1 for line in outline_text.splitlines() if line.strip())
+    budget = int(max_words * TOKENS_PER_WORD) + outline_lines * TOKENS_PER_OUTLINE_LINE
+
+    return max(MIN_MAX_TOKENS, min(cap, budget))
+
+
+def estimate_section_max_tokens(section_outline: str, cap: int = 2000) -> int:
+    """
+    Estimate a completion token budget for a single section.
+
+    Args:
+        section_outline: Outline/bullet points for the section
+        cap: Upper bound for the budget
+
+    Returns:
+        max_tokens value to request
+    """
+    outline_lines = sum(1 for line in section_outline.splitlines() if line.strip())
+    budget = SECTION_BASE_TOKENS + outline_lines * TOKENS_PER_SECTION_POINT
+
+    return max(MIN_MAX_TOKENS, min(cap, budget))
@@ -0,0 +1,294 @@
+"""Cache for LLM responses keyed by prompt hash, in memory and optionally on disk."""
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
+
+from models.llm_interface import BaseLLM
+
+logger = logging.getLogger(__name__)
+
+# Sampling above this temperature is treated as intentionally non-deterministic
+MAX_CACHEABLE_TEMPERATURE = 0.9
+
+# SQLite file that keeps responses across restarts; set LLM_CACHE_PATH= (empty) to disable.
+# Relative paths are resolved against the project root, not the working directory.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache/responses.sqlite3")
+# Responses kept on disk before the least recently used are deleted
+MAX_DISK_ENTRIES = 2000
+
+
+class LLMResponseCache:
+    """Thread-safe LRU cache of LLM responses, optionally backed by SQLite."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        path: Optional[str] = None,
+        max_disk_entries: int = MAX_DISK_ENTRIES
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory before evicting the oldest
+            path: SQLite file to persist responses in, opened on first use
+                (memory only if None or unusable)
+            max_disk_entries: Maximum number of responses kept on disk
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_opened = False
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """Get the SQLite store, opening it on first use; the caller holds the lock."""
+        if not self._disk_opened:
+            self._disk_opened = True
+            if self.path:
+                self._open_disk(self.path)
+        return self._db
+
+    def _open_disk(self, path: str) -> None:
+        """Open (creating if needed) the SQLite store; failures leave the cache memory-only."""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            db.commit()
+            self._db = db
+            logger.info("LLM response cache persisted to %s", path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("LLM response cache kept in memory only, cannot open %s: %s", path, e)
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """
+        Build a SHA-256 cache key from request parts.
+
+        Args:
+            *parts: Values identifying the request (model, prompts, parameters)
+
+        Returns:
+            Hex digest key
+        """
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(str(part).encode('utf-8'))
+            hasher.update(b'\x00')
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, marking it as recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+            db = self._disk()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value = gzip.decompress(row[0]).decode('utf-8')
+                db.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+                db.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("LLM response cache disk read failed: %s", e)
+                return None
+
+            self._remember(key, value)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        with self._lock:
+            self._remember(key, value)
+
+            db = self._disk()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, accessed_at) VALUES (?, ?, ?)",
+                    (key, gzip.compress(value.encode('utf-8')), time.time())
+                )
+                db.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_disk_entries,)
+                )
+                db.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("LLM response cache disk write failed: %s", e)
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store a response in memory; the caller holds the lock."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            db = self._disk()
+            if db is not None:
+                try:
+                    db.execute("DELETE FROM responses")
+                    db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("LLM response cache disk clear failed: %s", e)
+
+
+response_cache = LLMResponseCache(
+    path=str(PROJECT_ROOT / LLM_CACHE_PATH) if LLM_CACHE_PATH else None
+)
+
+
+def _request_key(
+    llm: BaseLLM,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: Optional[int]
+) -> str:
+    """Build the cache key for a request from the model, prompts and effective parameters."""
+    return response_cache.make_key(
+        llm.config.provider.value,
+        llm.config.get_default_model(),
+        system_prompt,
+        prompt,
+        temperature,
+        llm.resolve_max_tokens(max_tokens)
+    )
+
+
+def cached_generate(
+    llm: BaseLLM,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    bust_cache: bool = False
+) -> str:
+    """
+    Generate text, reusing the response of an identical earlier request.
+
+    Only successful responses are cached. High-temperature requests and
+    requests with bust_cache=True always go to the LLM.
+
+    Args:
+        llm: LLM instance
+        prompt: User prompt
+        system_prompt: System prompt (optional)
+        temperature: Temperature override (optional)
+        max_tokens: Max tokens override (optional)
+        bust_cache: Skip the cache lookup and refresh the stored response
+
+    Returns:
+        Generated text
+    """
+    effective_temperature = llm.resolve_temperature(temperature)
+    if effective_temperature > MAX_CACHEABLE_TEMPERATURE:
+        return llm.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    key = _request_key(llm, prompt, system_prompt, effective_temperature, max_tokens)
+
+    if not bust_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            logger.info("LLM response served from cache")
+            return cached
+
+    response = llm.generate(
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    response_cache.set(key, response)
+    return response
+
+
+def cached_generate_stream(
+    llm: BaseLLM,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    bust_cache: bool = False
+) -> Iterator[str]:
+    """
+    Stream generated text, replaying the response of an identical earlier request.
+
+    A cached response is yielded as a single chunk. A streamed response is
+    cached only once the stream completes without error.
+
+    Args:
+        llm: LLM instance
+        prompt: User prompt
+        system_prompt: System prompt (optional)
+        temperature: Temperature override (optional)
+        max_tokens: Max tokens override (optional)
+        bust_cache: Skip the cache lookup and refresh the stored response
+
+    Yields:
+        Text chunks
+    """
+    effective_temperature = llm.resolve_temperature(temperature)
+    if effective_temperature > MAX_CACHEABLE_TEMPERATURE:
+        yield from llm.generate_stream(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return
+
+    key = _request_key(llm, prompt, system_prompt, effective_temperature, max_tokens)
+
+    if not bust_cache:
+        cached = response_cache.get(key)
+        if cached is not None:
+            logger.info("LLM response served from cache")
+            yield cached
+            return
+
+    chunks = []
+    for chunk in llm.generate_stream(
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens
+    ):
+        chunks.append(chunk)
+        yield chunk
+    response_cache.set(key, "".join(chunks))
@@ -0,0 +1,92 @@
+"""Compression of data blobs before they are injected into LLM prompts."""
+
+import json
+import logging
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Data shorter than this is injected as-is
+COMPRESSION_THRESHOLD = 4000
+# Longest string value kept verbatim; longer values are truncated
+MAX_TEXT_LENGTH = 2000
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a value carries no information for the LLM."""
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _prune(value: Any, drop_keys: frozenset, max_text_length: int) -> Any:
+    """
+    Recursively remove empty values and blocklisted keys.
+
+    Args:
+        value: Parsed JSON value
+        drop_keys: Keys to remove from every object
+        max_text_length: Longest string value kept verbatim
+
+    Returns:
+        Pruned value
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            if key in drop_keys:
+                continue
+            item = _prune(item, drop_keys, max_text_length)
+            if _is_empty(item):
+                continue
+            pruned[key] = item
+        return pruned
+
+    if isinstance(value, list):
+        pruned_items = (_prune(item, drop_keys, max_text_length) for item in value)
+        return [item for item in pruned_items if not _is_empty(item)]
+
+    if isinstance(value, str) and len(value) > max_text_length:
+        return value[:max_text_length].rstrip() + "..."
+
+    return value
+
+
+def compress_data(
+    data: str,
+    drop_keys: Iterable[str] = (),
+    max_text_length: int = MAX_TEXT_LENGTH
+) -> str:
+    """
+    Shrink a JSON data blob without losing its facts.
+
+    Whitespace from pretty-printing, null/empty fields and blocklisted keys
+    are removed, and very long string values are truncated. Non-JSON input
+    is returned unchanged.
+
+    Args:
+        data: Data string (usually json.dumps output)
+        drop_keys: Keys to remove from every object
+        max_text_length: Longest string value kept verbatim
+
+    Returns:
+        Compressed data string
+    """
+    try:
+        parsed = json.loads(data)
+    except (TypeError, ValueError):
+        return data
+
+    compressed = json.dumps(
+        _prune(parsed, frozenset(drop_keys), max_text_length),
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+
+    if len(compressed) >= len(data):
+        return data
+
+    logger.info(
+        "Compressed prompt data from %d to %d chars (%.0f%%)",
+        len(data), len(compressed), 100 * len(compressed) / len(data)
+    )
+    return compressed
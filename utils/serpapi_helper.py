@@ -1,6 +1,7 @@
 """SerpAPI helper for fetching trends and latest information."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from serpapi import GoogleSearch
 import os
@@ -156,6 +157,10 @@ class SerpAPIHelper:
         """
         Get formatted context for LLM from search results.
 
+        The web search, trending topics and news lookups are independent
+        requests, so they run in a thread pool and the context takes as long
+        as the slowest one.
+
         Args:
             query: Search query
             include_trends: Include trending topics
@@ -164,33 +169,48 @@ class SerpAPIHelper:
         Returns:
             Formatted context string
         """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            search_future = executor.submit(self.search, query, num_results=3)
+            trends_future = executor.submit(self.get_trending_topics, query) if include_trends else None
+            news_future = executor.submit(self.get_news, query, num_results=3) if include_news else None
+
+            return self._format_context(
+                query,
+                search_future.result(),
+                trends_future.result() if trends_future else [],
+                news_future.result() if news_future else []
+            )
+
+    @staticmethod
+    def _format_context(
+        query: str,
+        search_results: List[Dict[str, Any]],
+        trending: List[str],
+        news: List[Dict[str, Any]]
+    ) -> str:
+        """Format SerpAPI lookup results as LLM context."""
         context = f"Current Information for: {query}\n\n"
 
-        # Get search results
-        search_results = self.search(query, num_results=3)
+        # Add search results
         if search_results:
             context += "Recent Web Results:\n"
             for i, result in enumerate(search_results, 1):
                 context += f"{i}. {result['title']}\n"
                 context += f"   {result['snippet']}\n\n"
 
-        # Get trending topics
-        if include_trends:
-            trending = self.get_trending_topics(query)
-            if trending:
-                context += "Related Trending Topics:\n"
-                for topic in trending[:5]:
-                    context += f"- {topic}\n"
-                context += "\n"
-
-        # Get news
-        if include_news:
-            news = self.get_news(query, num_results=3)
-            if news:
-                context += "Recent News:\n"
-                for i, article in enumerate(news, 1):
-                    context += f"{i}. {article['title']} ({article.get('date', 'N/A')})\n"
-                    context += f"   {article['snippet']}\n\n"
+        # Add trending topics
+        if trending:
+            context += "Related Trending Topics:\n"
+            for topic in trending[:5]:
+                context += f"- {topic}\n"
+            context += "\n"
+
+        # Add news
+        if news:
+            context += "Recent News:\n"
+            for i, article in enumerate(news, 1):
+                context += f"{i}. {article['title']} ({article.get('date', 'N/A')})\n"
+                context += f"   {article['snippet']}\n\n"
 
         return context
 